@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import time
+from typing import Callable, Dict, List
+
+_orchestrator_factories: List[Callable[[], DatabaseTestingInterface]] = []
+
+def run_backend_sweep(factoryIndex: int, batchSizes: List[int], records: int, cpus: List[int], runnerOptions: Dict[str, float], testerOptions: Dict[str, object], resultsStorePath: str = None) -> Dict[str, object]:
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+    database = _orchestrator_factories[factoryIndex]()
+    resultsStore = ResultsStore(resultsStorePath) if resultsStorePath is not None else None
+    tester = DatabaseTester([database], BenchmarkRunner(**runnerOptions), resultsStore, **testerOptions)
+    for recordsPerTransaction in batchSizes:
+        tester.testCreate(records, recordsPerTransaction)
+        tester.testRead(records, recordsPerTransaction)
+        tester.testUpdate(records, recordsPerTransaction)
+        tester.tesetDelete(records, recordsPerTransaction)
+    results = tester.exportResults()
+    del tester, database
+    return results
+
+class BenchmarkOrchestrator:
+    def __init__(self, databaseFactories: List[Callable[[], DatabaseTestingInterface]], batchSizes: List[int] = [1, 10, 100, 1000], records: int = 1000, isolated: bool = False, pinCpus: bool = True, maxWorkers: int = None,
+                 runnerOptions: Dict[str, float] = {}, testerOptions: Dict[str, object] = {}, resultsStorePath: str = None):
+        self.databaseFactories = databaseFactories
+        self.batchSizes = batchSizes
+        self.records = records
+        self.isolated = isolated
+        self.pinCpus = pinCpus
+        self.maxWorkers = maxWorkers
+        self.runnerOptions = runnerOptions
+        self.testerOptions = dict(testerOptions, runId=testerOptions.get('runId') or datetime.now().isoformat(timespec='seconds'))
+        self.resultsStorePath = resultsStorePath
+        self.elapsed = None
+
+    @staticmethod
+    def __availableCpus() -> List[int]:
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    def __workers(self) -> int:
+        if self.isolated:
+            return 1
+        return max(min(self.maxWorkers or len(self.__availableCpus()), len(self.databaseFactories)), 1)
+
+    def __cpuSets(self, workers: int) -> List[List[int]]:
+        if not self.pinCpus or self.isolated or not hasattr(os, "sched_setaffinity"):
+            return [[] for _ in range(workers)]
+        cpus = self.__availableCpus()
+        if len(cpus) < workers:
+            return [[cpus[index % len(cpus)]] for index in range(workers)]
+        share = len(cpus) // workers
+        return [cpus[index * share:(index + 1) * share] for index in range(workers)]
+
+    def run(self) -> DatabaseTester:
+        global _orchestrator_factories
+        _orchestrator_factories = self.databaseFactories
+        workers = self.__workers()
+        cpuSets = self.__cpuSets(workers)
+        start = time.perf_counter()
+        with multiprocessing.get_context("fork").Pool(workers, maxtasksperchild=1) as pool:
+            pending = [pool.apply_async(run_backend_sweep, (index, self.batchSizes, self.records, cpuSets[index % workers], self.runnerOptions, self.testerOptions, self.resultsStorePath))
+                       for index in range(len(self.databaseFactories))]
+            results = [result.get() for result in pending]
+        self.elapsed = time.perf_counter() - start
+
+        tester = DatabaseTester([], **self.testerOptions)
+        for result in results:
+            tester.importResults(result)
+        return tester
\ No newline at end of file
@@ -0,0 +1,117 @@
+import math
+import time
+from statistics import NormalDist
+from typing import Callable, Dict, Optional, Tuple
+
+class BenchmarkRunner:
+    KEY_CONSUMING_OPERATIONS = ('create', 'delete')
+    POPULATE_CHUNK = 10000
+
+    def __init__(self, warmupIterations: int = 3, minSamples: int = 10, maxSamples: int = 200, confidence: float = 0.95, relativeError: float = 0.05):
+        self.warmupIterations = warmupIterations
+        self.minSamples = minSamples
+        self.maxSamples = maxSamples
+        self.confidence = confidence
+        self.relativeError = relativeError
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    def getSettings(self) -> Tuple:
+        return (self.warmupIterations, self.minSamples, self.maxSamples, self.confidence, self.relativeError, self.POPULATE_CHUNK)
+
+    def __operation(self, database: DatabaseTestingInterface, operation: str, recordsPerTransaction: int, insertMode: InsertMode, readMode: ReadMode) -> Callable[[int], Optional[int]]:
+        if operation == 'create':
+            return lambda offset: database.create(recordsPerTransaction, insert_mode=insertMode, offset=offset)
+        if operation == 'read':
+            return lambda offset: database.read(recordsPerTransaction, offset=offset, read_mode=readMode)
+        method = getattr(database, operation)
+        return lambda offset: method(recordsPerTransaction, offset=offset)
+
+    def getTableSize(self, database: DatabaseTestingInterface, operation: str, recordsPerTransaction: int, tableSize: int = None) -> Optional[int]:
+        if operation == 'create':
+            return None
+        if tableSize is None:
+            tableSize = recordsPerTransaction * (self.warmupIterations + self.maxSamples)
+        return max(min(tableSize, database.getDatasetSize()), recordsPerTransaction)
+
+    def run(self, database: DatabaseTestingInterface, operation: str, recordsPerTransaction: int = 1, histogram: LatencyHistogram = None, insertMode: InsertMode = InsertMode.ROW, tableSize: int = None, readMode: ReadMode = ReadMode.LIMIT, sampler: ResourceSampler = None, profiler: OperationProfiler = None) -> Dict[str, float]:
+        method = self.__operation(database, operation, recordsPerTransaction, insertMode, readMode)
+        consumesKeys = operation in self.KEY_CONSUMING_OPERATIONS
+        poolSize = database.getDatasetSize() if operation == 'create' else self.getTableSize(database, operation, recordsPerTransaction, tableSize)
+        slots = max(poolSize // recordsPerTransaction, 1)
+
+        def populate():
+            database.truncate()
+            if operation != 'create':
+                chunk = min(poolSize, self.POPULATE_CHUNK)
+                database.create(chunk, transactions=poolSize // chunk, insert_mode=InsertMode.BULK)
+                if poolSize % chunk:
+                    database.create(poolSize % chunk, insert_mode=InsertMode.BULK, offset=poolSize - poolSize % chunk)
+
+        populate()
+        sampling = False
+        slot = 0
+        iteration = 0
+        samples = 0
+        mean = 0.0
+        squaredDeviations = 0.0
+        halfWidth = math.inf
+        totalLatency = 0
+        recordsProcessed = 0
+        while samples < self.maxSamples:
+            if slot == slots:
+                if consumesKeys:
+                    if sampling:
+                        sampler.pause()
+                    populate()
+                    if sampling:
+                        sampler.resume()
+                slot = 0
+            offset = slot * recordsPerTransaction
+            slot += 1
+
+            if sampler is not None and not sampling and iteration >= self.warmupIterations:
+                sampler.start()
+                sampling = True
+            profiling = profiler is not None and iteration >= self.warmupIterations
+            if profiling:
+                profiler.profile.enable()
+            database.prepareRows(offset, offset + recordsPerTransaction)
+            start = time.perf_counter_ns()
+            records = method(offset)
+            latency = time.perf_counter_ns() - start
+            database.releaseRows(offset, offset + recordsPerTransaction)
+            if profiling:
+                profiler.profile.disable()
+
+            iteration += 1
+            if iteration <= self.warmupIterations:
+                continue
+            if histogram is not None:
+                histogram.record(latency)
+            samples += 1
+            totalLatency += latency
+            recordsProcessed += recordsPerTransaction if records is None else records
+            delta = latency - mean
+            mean += delta / samples
+            squaredDeviations += delta * (latency - mean)
+            if samples >= max(self.minSamples, 2):
+                halfWidth = self.z * math.sqrt(squaredDeviations / (samples - 1) / samples)
+                if halfWidth <= self.relativeError * mean:
+                    break
+
+        resources = sampler.stop() if sampling else None
+        stddev = math.sqrt(squaredDeviations / (samples - 1)) if samples > 1 else 0.0
+        throughput = recordsProcessed * 1e9 / totalLatency if totalLatency else 0.0
+        result = {
+            'samples': samples,
+            'mean': mean / 1e9,
+            'stddev': stddev / 1e9,
+            'halfWidth': halfWidth / 1e9,
+            'throughput': throughput
+        }
+        if operation == 'read':
+            rows, resultBytes = database.measureResultBytes(lambda: method(0))
+            result['bytesPerSecond'] = throughput * resultBytes / rows if rows else 0.0
+        if resources is not None:
+            result['resources'] = resources
+        return result
\ No newline at end of file
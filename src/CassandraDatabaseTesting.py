@@ -1,38 +1,130 @@
+import asyncio
 import cassandra
 from cassandra.cluster import Cluster
-from cassandra.query import SimpleStatement, BatchStatement
+from cassandra.concurrent import execute_concurrent
+from cassandra.query import SimpleStatement, BatchStatement, BatchType, PreparedStatement
 from typing import List, Tuple
 
 class CassandraDatabaseTesting(DatabaseTestingInterface):
-    def __init__(self, connection_string: str, csv_file_paths: List[str]):
-        self.cluster = Cluster([connection_string])
-        self.session = self.cluster.connect()
-        self.csv_data = {}
+    DURABILITY_SETTINGS = {
+        DurabilityProfile.STRICT: (cassandra.ConsistencyLevel.ALL, cassandra.ConsistencyLevel.ALL),
+        DurabilityProfile.DEFAULT: (cassandra.ConsistencyLevel.ONE, cassandra.ConsistencyLevel.ONE),
+        DurabilityProfile.RELAXED: (cassandra.ConsistencyLevel.ANY, cassandra.ConsistencyLevel.ONE)
+    }
+
+    def __init__(self, connection_string: str, csv_file_paths: List[str], create_schema: bool = True, durability_profile: DurabilityProfile = DurabilityProfile.DEFAULT, pool: ConnectionPool = None,
+                 replication_factor: int = 1, write_concurrency: int = 32, max_batch_rows: int = 100):
+        self.pool = pool
+        self.session = pool.acquire() if pool is not None else Cluster(connection_string.split(",")).connect()
+        self.replication_factor = replication_factor
+        self.write_concurrency = write_concurrency
+        self.max_batch_rows = max_batch_rows
+        self.cluster = self.session.cluster
+        self.datasets = {}
         self.table_names = []
         self.table_column_names = {}
         self.KEYSPACE_NAME = "databaseTesting"
+        self.setDurabilityProfile(durability_profile)
 
         for file_path in csv_file_paths:
-            table_name = os.path.splitext(os.path.basename(file_path))[0]
-            self.table_names.append(table_name)
-            self.table_column_names[table_name], self.csv_data[table_name] = self.__parse_csv_data(file_path)
+            dataset = load_dataset(file_path)
+            self.table_names.append(dataset.name)
+            self.datasets[dataset.name] = dataset
+            self.table_column_names[dataset.name] = list(dataset.column_names)
 
         self.__normalize_table_column_names()
-        self.__execute_simple_statement(f"DROP KEYSPACE IF EXISTS {self.KEYSPACE_NAME}")
-        self.__create_tables()
+        if create_schema:
+            self.__execute_simple_statement(f"DROP KEYSPACE IF EXISTS {self.KEYSPACE_NAME}")
+            self.__create_tables()
+        else:
+            self.__execute_simple_statement(f"USE {self.KEYSPACE_NAME}")
 
     def __execute_simple_statement(self, query: str, parameters: Tuple = ()):
         statement = SimpleStatement(query, consistency_level=cassandra.ConsistencyLevel.ONE)
         self.session.execute(statement, parameters)
 
-    def __execute_batch_statement(self, statements: List[str], parameters_list: List[Tuple[Tuple]]):
-        batch = BatchStatement(consistency_level=cassandra.ConsistencyLevel.ONE)
-        for statement, parameters in zip(statements, parameters_list):
+    def __batch_statement(self, statement: PreparedStatement, parameters_list: List[Tuple]) -> BatchStatement:
+        batch = BatchStatement(consistency_level=self.write_consistency_level)
+        for parameters in parameters_list:
             batch.add(statement, parameters)
-        self.session.execute(batch)
+        return batch
+
+    def __execute_batch_statement(self, statement: PreparedStatement, parameters_list: List[Tuple]):
+        self.session.execute(self.__batch_statement(statement, parameters_list))
+
+    @staticmethod
+    def __wrap_future(response_future) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(method, value):
+            if not future.done():
+                method(value)
+
+        response_future.add_callbacks(lambda result: loop.call_soon_threadsafe(settle, future.set_result, result),
+                                      lambda error: loop.call_soon_threadsafe(settle, future.set_exception, error))
+        return future
+
+    def __execute_token_aware_batches(self, statement: PreparedStatement, parameters_list: List[Tuple]):
+        token_map = self.cluster.metadata.token_map
+        batches = {}
+        for parameters in parameters_list:
+            bound_statement = statement.bind(parameters)
+            replica = None
+            if token_map is not None:
+                replicas = token_map.get_replicas(self.KEYSPACE_NAME.lower(), token_map.token_class.from_key(bound_statement.routing_key))
+                replica = replicas[0] if replicas else None
+            batches.setdefault(replica, []).append(bound_statement)
+        statements = []
+        for bound_statements in batches.values():
+            for start in range(0, len(bound_statements), self.max_batch_rows):
+                batch = BatchStatement(batch_type=BatchType.UNLOGGED, consistency_level=self.write_consistency_level)
+                for bound_statement in bound_statements[start:start + self.max_batch_rows]:
+                    batch.add(bound_statement)
+                statements.append((batch, None))
+        execute_concurrent(self.session, statements, concurrency=self.write_concurrency)
+
+    def __execute_partitioned(self, statement: PreparedStatement, parameters_list: List[Tuple]):
+        partitions = {}
+        for parameters in parameters_list:
+            partitions.setdefault(parameters[0], []).append(parameters)
+        statements = []
+        for partition in partitions.values():
+            if len(partition) == 1:
+                statements.append((statement, partition[0]))
+                continue
+            batch = BatchStatement(batch_type=BatchType.UNLOGGED, consistency_level=self.write_consistency_level)
+            for parameters in partition:
+                batch.add(statement, parameters)
+            statements.append((batch, None))
+        execute_concurrent(self.session, statements, concurrency=self.write_concurrency)
+
+    def __prepare(self, query: str, consistency_level) -> PreparedStatement:
+        statement = self.session.prepare(query)
+        statement.consistency_level = consistency_level
+        return statement
+
+    def prepareStatement(self, table_name: str, operation: str) -> PreparedStatement:
+        column_names = self.table_column_names[table_name]
+        if operation == "insert":
+            return self.__prepare(f"INSERT INTO {table_name} ({', '.join(column_names)}) VALUES (?, ?, ?, ?)", self.write_consistency_level)
+        if operation == "update":
+            return self.__prepare(f"UPDATE {table_name} SET {column_names[2]} = ? WHERE {column_names[0]} = ? AND {column_names[1]} = ?", self.write_consistency_level)
+        if operation == "delete":
+            return self.__prepare(f"DELETE FROM {table_name} WHERE {column_names[0]} = ? AND {column_names[1]} = ?", self.write_consistency_level)
+        if operation == "read_limit":
+            return self.__prepare(f"SELECT * FROM {table_name} LIMIT ?", self.read_consistency_level)
+        if operation == "read_point":
+            return self.__prepare(f"SELECT * FROM {table_name} WHERE {column_names[0]} = ? AND {column_names[1]} = ?", self.read_consistency_level)
+        if operation == "read_range":
+            return self.__prepare(f"SELECT * FROM {table_name} WHERE {column_names[0]} >= ? AND {column_names[0]} <= ? ALLOW FILTERING", self.read_consistency_level)
+        if operation == "read_stream":
+            return self.__prepare(f"SELECT * FROM {table_name}", self.read_consistency_level)
+        return super().prepareStatement(table_name, operation)
 
     def __create_tables(self):
-        self.__execute_simple_statement(f"CREATE KEYSPACE {self.KEYSPACE_NAME} WITH REPLICATION = {{'class': 'SimpleStrategy', 'replication_factor': 1}}")
+        self.clearStatements()
+        self.__execute_simple_statement(f"CREATE KEYSPACE {self.KEYSPACE_NAME} WITH REPLICATION = {{'class': 'SimpleStrategy', 'replication_factor': {self.replication_factor}}}")
         self.__execute_simple_statement(f"USE {self.KEYSPACE_NAME}")
         for table_name in self.table_names:
             self.__execute_simple_statement(f"CREATE TABLE IF NOT EXISTS {table_name} ({self.table_column_names[table_name][0]} timestamp, {self.table_column_names[table_name][1]} timestamp, {self.table_column_names[table_name][2]} float, {self.table_column_names[table_name][3]} int, PRIMARY KEY ({self.table_column_names[table_name][0]}, {self.table_column_names[table_name][1]}))")
@@ -42,65 +134,124 @@ class CassandraDatabaseTesting(DatabaseTestingInterface):
             column_names = [''.join(c for c in name.strip() if c.isalnum() or c == '_') for name in column_names]
             self.table_column_names[table_name] = column_names
 
-    def __parse_csv_data(self, file_path: str) -> Tuple[List[str], List[Tuple[str, str, float, int]]]:
-        MAX_DATA_READ = 1000
-        with open(file_path, "r") as f:
-            reader = csv.reader(f, delimiter="|")
-            column_names = next(reader)
-            rows = itertools.islice(reader, MAX_DATA_READ)
-            data = []
-            for row in rows:
-                row[0] = row[0].replace(",", ".")
-                row[1] = row[1].replace(",", ".")
-                data.append(tuple(row))
-
-        return column_names, data
-
-    def create(self, rows_created: int = 1, transactions: int = 1):
-        for table_name, data in self.csv_data.items():
+    def create(self, rows_created: int = 1, transactions: int = 1, insert_mode: InsertMode = InsertMode.ROW, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "insert")
             for transaction in range(transactions):
-                statements = []
-                parameters_list = []
-                for i in range(rows_created):
-                    statements.append(f"INSERT INTO {table_name} ({self.table_column_names[table_name][0]}, {self.table_column_names[table_name][1]}, {self.table_column_names[table_name][2]}, {self.table_column_names[table_name][3]}) VALUES (%s, %s, %s, %s)")
-                    parameters_list.append((data[i][0], data[i][1], float(data[i][2]), int(data[i][3])))
+                rows = dataset.rows(offset + transaction*rows_created, offset + (transaction+1)*rows_created)
+                if insert_mode == InsertMode.PARTITIONED:
+                    self.__execute_partitioned(statement, rows)
+                elif insert_mode != InsertMode.ROW:
+                    self.__execute_token_aware_batches(statement, rows)
+                else:
+                    self.__execute_batch_statement(statement, rows)
 
-                self.__execute_batch_statement(statements=statements, parameters_list=parameters_list)
+    def read(self, rows_read: int = 1, transactions: int = 1, offset: int = 0, read_mode: ReadMode = ReadMode.LIMIT) -> int:
+        rows_fetched = 0
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, f"read_{read_mode.value}")
+            for transaction in range(transactions):
+                rows = dataset.rows(offset + transaction*rows_read, offset + (transaction+1)*rows_read)
+                if read_mode == ReadMode.POINT:
+                    for row in rows:
+                        rows_fetched += self.countRows(self.session.execute(statement, (row[0], row[1])).current_rows)
+                    continue
+                if read_mode == ReadMode.RANGE:
+                    if not len(rows):
+                        continue
+                    bound_statement = statement.bind(rows.timestamp_range(0))
+                elif read_mode == ReadMode.STREAM:
+                    bound_statement = statement.bind(())
+                else:
+                    rows_fetched += self.countRows(self.session.execute(statement, (rows_read,)).current_rows[:1])
+                    continue
+                bound_statement.fetch_size = rows_read
+                result = self.session.execute(bound_statement)
+                rows_fetched += self.countRows(result.current_rows)
+                while result.has_more_pages:
+                    result.fetch_next_page()
+                    rows_fetched += self.countRows(result.current_rows)
+        return rows_fetched
 
-    def read(self, rows_read: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def update(self, rows_updated: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "update")
             for transaction in range(transactions):
-                statement = f"SELECT * FROM {table_name} LIMT {rows_read}"
-                self.session.execute(statement)
+                rows = dataset.rows(offset + transaction*rows_updated, offset + (transaction+1)*rows_updated)
+                self.__execute_batch_statement(statement, [(row[2], row[0], row[1]) for row in rows])
 
-    def update(self, rows_updated: int = 1, transactions: int = 1):
-        for table_name, data in self.csv_data.items():
+    def delete(self, rows_deleted: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "delete")
             for transaction in range(transactions):
-                statements = []
-                parameters_list = []
-                for i in range(rows_updated):
-                    statements.append(f"UPDATE {table_name} SET {self.table_column_names[table_name][2]} = %s WHERE {self.table_column_names[table_name][0]} = %s AND {self.table_column_names[table_name][1]} = %s")
-                    parameters_list.append((float(self.csv_data[table_name][i][2]), self.csv_data[table_name][i][0], self.csv_data[table_name][i][1]))
+                rows = dataset.rows(offset + transaction*rows_deleted, offset + (transaction+1)*rows_deleted)
+                self.__execute_batch_statement(statement, [(row[0], row[1]) for row in rows])
 
-                self.__execute_batch_statement(statements=statements, parameters_list=parameters_list)
+    def supportsAsync(self) -> bool:
+        return True
 
-    def delete(self, rows_deleted: int = 1, transactions: int = 1):
-        for table_name, data in self.csv_data.items():
+    async def executeAsync(self, operation: str, rows: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, {"create": "insert", "read": "read_limit"}.get(operation, operation))
             for transaction in range(transactions):
-                statements = []
-                parameters_list = []
-                for i in range(rows_deleted):
-                    statements.append(f"DELETE FROM {table_name} WHERE {self.table_column_names[table_name][0]} = %s AND {self.table_column_names[table_name][1]} = %s")
-                    parameters_list.append((self.csv_data[table_name][i][0], self.csv_data[table_name][i][1]))
-
-                self.__execute_batch_statement(statements=statements, parameters_list=parameters_list)
+                if operation == "read":
+                    await self.__wrap_future(self.session.execute_async(statement, (rows,)))
+                    continue
+                batch_rows = dataset.rows(offset + transaction*rows, offset + (transaction+1)*rows)
+                if operation == "update":
+                    batch_rows = [(row[2], row[0], row[1]) for row in batch_rows]
+                elif operation == "delete":
+                    batch_rows = [(row[0], row[1]) for row in batch_rows]
+                await self.__wrap_future(self.session.execute_async(self.__batch_statement(statement, batch_rows)))
 
     def reset(self):
         self.__execute_simple_statement(f"DROP KEYSPACE {self.KEYSPACE_NAME}")
         self.__create_tables()
 
+    def truncate(self):
+        for table_name in self.table_names:
+            self.__execute_simple_statement(f"TRUNCATE {table_name}")
+
     def getName(self) -> str:
-        return "Cassandra"
+        return " ".join(["Cassandra"] + self.getConfiguration())
+
+    def getConfiguration(self) -> List[str]:
+        return ([] if self.replication_factor == 1 else [f"rf={self.replication_factor}"]) + super().getConfiguration()
+
+    def getInsertModes(self) -> List[InsertMode]:
+        return [InsertMode.ROW, InsertMode.BULK, InsertMode.PARTITIONED]
+
+    def getDurabilityProfiles(self) -> List[DurabilityProfile]:
+        return [DurabilityProfile.STRICT, DurabilityProfile.DEFAULT, DurabilityProfile.RELAXED]
+
+    def setDurabilityProfile(self, durability_profile: DurabilityProfile):
+        super().setDurabilityProfile(durability_profile)
+        self.write_consistency_level, self.read_consistency_level = self.DURABILITY_SETTINGS[durability_profile]
+        self.clearStatements()
+
+    def getSchemaProfiles(self) -> List[SchemaProfile]:
+        return [SchemaProfile.PRIMARY_KEY]
+
+    def getScanReadModes(self) -> List[ReadMode]:
+        return [ReadMode.RANGE, ReadMode.STREAM]
+
+    def getServerProcessNames(self) -> List[str]:
+        return ["CassandraDaemon"]
+
+    def getSoftwareVersions(self) -> List[str]:
+        return [f"cassandra-driver {cassandra.__version__}", f"server {self.session.execute('SELECT release_version FROM system.local').one()[0]}"]
+
+    @staticmethod
+    def createPool(contact_points: List[str], size: int = 1, protocol_version: int = None, executor_threads: int = 2, compression: bool = True, warmup: bool = True) -> ConnectionPool:
+        options = {"executor_threads": executor_threads, "compression": compression}
+        if protocol_version is not None:
+            options["protocol_version"] = protocol_version
+        return ConnectionPool(lambda: Cluster(contact_points, **options).connect(), size,
+                              healthCheck=lambda session: session.execute("SELECT release_version FROM system.local"),
+                              close=lambda session: session.cluster.shutdown(), warmup=warmup)
 
     def __del__(self):
-        self.session.close()
\ No newline at end of file
+        if self.pool is not None:
+            self.pool.release(self.session)
+        else:
+            self.session.close()
\ No newline at end of file
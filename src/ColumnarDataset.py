@@ -0,0 +1,107 @@
+import hashlib
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple, Union
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+class RowSlice:
+    __slots__ = ("dataset", "start", "stop")
+
+    def __init__(self, dataset: "ColumnarDataset", start: int, stop: int):
+        self.dataset = dataset
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def column(self, index: int) -> memoryview:
+        return self.dataset.columns[index][self.start:self.stop]
+
+    def timestamps(self, index: int, as_text: bool = False) -> List[Union[datetime, str]]:
+        return self.dataset.timestamp_slice(index, self.start, self.stop, as_text)
+
+    def timestamp_range(self, index: int) -> Tuple[datetime, datetime]:
+        column = self.column(index)
+        return EPOCH + MICROSECOND * min(column), EPOCH + MICROSECOND * max(column)
+
+    def __iter__(self) -> Iterator[Row]:
+        return zip(self.timestamps(0), self.timestamps(1), self.column(2), self.column(3))
+
+    def text_rows(self) -> Iterator[Tuple[str, str, float, int]]:
+        return zip(self.timestamps(0, True), self.timestamps(1, True), self.column(2), self.column(3))
+
+class ColumnarDataset:
+    __slots__ = ("name", "column_names", "columns", "__fingerprint", "__prepared")
+    TYPECODES = ("q", "q", "d", "i")
+
+    def __init__(self, name: str, column_names: List[str], columns: Tuple[array, array, array, array]):
+        self.name = name
+        self.column_names = column_names
+        self.columns = tuple(memoryview(column) for column in columns)
+        self.__fingerprint = None
+        self.__prepared = {}
+
+    @classmethod
+    def from_csv(cls, csv_dataset: CsvDataset, batch_size: int = 65536) -> "ColumnarDataset":
+        columns = tuple(array(typecode) for typecode in cls.TYPECODES)
+        for batch in csv_dataset.batches(batch_size):
+            columns[0].extend((row[0] - EPOCH) // MICROSECOND for row in batch)
+            columns[1].extend((row[1] - EPOCH) // MICROSECOND for row in batch)
+            columns[2].extend(row[2] for row in batch)
+            columns[3].extend(row[3] for row in batch)
+        return cls(csv_dataset.name, list(csv_dataset.column_names), columns)
+
+    def __len__(self) -> int:
+        return len(self.columns[0])
+
+    def fingerprint(self) -> str:
+        if self.__fingerprint is None:
+            digest = hashlib.sha1("|".join(self.column_names).encode())
+            for column in self.columns:
+                digest.update(column)
+            self.__fingerprint = digest.hexdigest()
+        return self.__fingerprint
+
+    def __convert(self, index: int, start: int, stop: int) -> List[datetime]:
+        return list(map(EPOCH.__add__, map(MICROSECOND.__mul__, self.columns[index][start:stop])))
+
+    def timestamp_slice(self, index: int, start: int, stop: int, as_text: bool = False) -> List[Union[datetime, str]]:
+        for window_start, window_stop, timestamps in list(self.__prepared.values()):
+            if window_start <= start and stop <= window_stop:
+                return timestamps[(index, as_text)][start - window_start:stop - window_start]
+        timestamps = self.__convert(index, start, stop)
+        return [timestamp.isoformat(" ") for timestamp in timestamps] if as_text else timestamps
+
+    def prepare(self, start: int, stop: int):
+        rows = self.rows(start, stop)
+        timestamps = {}
+        for index in (0, 1):
+            timestamps[(index, False)] = self.__convert(index, rows.start, rows.stop)
+            timestamps[(index, True)] = [timestamp.isoformat(" ") for timestamp in timestamps[(index, False)]]
+        self.__prepared[(start, stop)] = (rows.start, rows.stop, timestamps)
+
+    def release(self, start: int, stop: int):
+        self.__prepared.pop((start, stop), None)
+
+    def rows(self, start: int, stop: int) -> RowSlice:
+        start = min(max(start, 0), len(self))
+        return RowSlice(self, start, max(start, min(stop, len(self))))
+
+    def batches(self, batch_size: int, start: int = 0) -> Iterator[RowSlice]:
+        for batch_start in range(start, len(self), batch_size):
+            yield self.rows(batch_start, batch_start + batch_size)
+
+_datasets: Dict[str, ColumnarDataset] = {}
+
+def load_dataset(file_path: Union[str, ColumnarDataset]) -> ColumnarDataset:
+    if not isinstance(file_path, str):
+        return file_path
+    key = os.path.abspath(file_path)
+    if key not in _datasets:
+        csv_dataset = CsvDataset(file_path)
+        _datasets[key] = ColumnarDataset.from_csv(csv_dataset)
+        csv_dataset.close()
+    return _datasets[key]
\ No newline at end of file
@@ -0,0 +1,130 @@
+import asyncio
+import multiprocessing
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from enum import Enum
+from typing import Callable, Dict, List, Tuple
+import matplotlib.pyplot as plt
+
+class WorkerKind(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+    ASYNCIO = "asyncio"
+
+_worker_barrier = None
+_load_factories: List[Callable[[], DatabaseTestingInterface]] = []
+
+def _set_worker_barrier(barrier):
+    global _worker_barrier
+    _worker_barrier = barrier
+
+def run_load_worker(databaseFactory: Callable[[], DatabaseTestingInterface], operation: str, offset: int, recordsPerTransaction: int, transactions: int, barrier=None) -> Tuple[float, float, int]:
+    database = databaseFactory()
+    method = getattr(database, operation)
+    database.prepareRows(offset, offset + recordsPerTransaction * transactions)
+    (barrier or _worker_barrier).wait()
+    start = time.perf_counter()
+    method(recordsPerTransaction, transactions, offset=offset)
+    end = time.perf_counter()
+    database.releaseRows(offset, offset + recordsPerTransaction * transactions)
+    del database
+    return start, end, recordsPerTransaction * transactions
+
+def run_load_process(factoryIndex: int, operation: str, offset: int, recordsPerTransaction: int, transactions: int) -> Tuple[float, float, int]:
+    return run_load_worker(_load_factories[factoryIndex], operation, offset, recordsPerTransaction, transactions)
+
+class ConcurrentLoadGenerator:
+    BARRIER_TIMEOUT = 120
+
+    def __init__(self, databaseFactory: Callable[[], DatabaseTestingInterface], workerKind: WorkerKind = WorkerKind.THREAD, resultsStore: ResultsStore = None, runId: str = None):
+        self.databaseFactory = databaseFactory
+        self.factoryIndex = len(_load_factories)
+        _load_factories.append(databaseFactory)
+        self.workerKind = workerKind
+        self.resultsStore = resultsStore
+        self.runId = runId or datetime.now().isoformat(timespec='seconds')
+        self.databaseName = None
+        self.databaseVersion = None
+        self.throughputTable: Dict[str, Dict[int, float]] = {}
+
+    def __prepare(self, operation: str, records: int):
+        database = self.databaseFactory()
+        self.databaseName = database.getName()
+        self.databaseVersion = (database.getDatasetHash(), database.getCodeVersion(), database.getDatasetSize())
+        if self.workerKind == WorkerKind.ASYNCIO and not database.supportsAsync():
+            raise ValueError(f"{self.databaseName} has no asynchronous driver path; WorkerKind.ASYNCIO is only supported by backends that implement executeAsync (currently Cassandra), use THREAD or PROCESS workers instead")
+        database.reset()
+        if operation != "create":
+            database.create(records, insert_mode=InsertMode.BULK)
+        del database
+
+    def __run_threads(self, jobs: List[Tuple]) -> List[Tuple[float, float, int]]:
+        barrier = threading.Barrier(len(jobs), timeout=self.BARRIER_TIMEOUT)
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(run_load_worker, *job, barrier) for job in jobs]
+            return [future.result() for future in futures]
+
+    def __run_processes(self, jobs: List[Tuple]) -> List[Tuple[float, float, int]]:
+        context = multiprocessing.get_context("fork")
+        barrier = context.Barrier(len(jobs), timeout=self.BARRIER_TIMEOUT)
+        with ProcessPoolExecutor(max_workers=len(jobs), mp_context=context, initializer=_set_worker_barrier, initargs=(barrier,)) as executor:
+            futures = [executor.submit(run_load_process, self.factoryIndex, *job[1:]) for job in jobs]
+            return [future.result() for future in futures]
+
+    async def __gather(self, jobs: List[Tuple]) -> List[Tuple[float, float, int]]:
+        database = self.databaseFactory()
+
+        async def client(operation: str, offset: int, recordsPerTransaction: int, transactions: int) -> Tuple[float, float, int]:
+            start = time.perf_counter()
+            await database.executeAsync(operation, recordsPerTransaction, transactions, offset=offset)
+            return start, time.perf_counter(), recordsPerTransaction * transactions
+
+        for _, _, offset, recordsPerTransaction, transactions in jobs:
+            database.prepareRows(offset, offset + recordsPerTransaction * transactions)
+        return await asyncio.gather(*(client(*job[1:]) for job in jobs))
+
+    def __run_asyncio(self, jobs: List[Tuple]) -> List[Tuple[float, float, int]]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.__gather(jobs)).result()
+
+    def run(self, operation: str, records: int, recordsPerTransaction: int = 1, clientCounts: List[int] = [1, 2, 4, 8]) -> Dict[int, float]:
+        if records < max(clientCounts) * recordsPerTransaction:
+            raise ValueError(f"{records} records cannot give each of {max(clientCounts)} clients a disjoint batch of {recordsPerTransaction} records")
+        for clients in clientCounts:
+            self.__prepare(operation, records)
+            recordsPerClient = records // clients
+            transactions = max(recordsPerClient // recordsPerTransaction, 1)
+            jobs = [(self.databaseFactory, operation, client * recordsPerClient, recordsPerTransaction, transactions) for client in range(clients)]
+
+            if self.workerKind == WorkerKind.PROCESS:
+                results = self.__run_processes(jobs)
+            elif self.workerKind == WorkerKind.ASYNCIO:
+                results = self.__run_asyncio(jobs)
+            else:
+                results = self.__run_threads(jobs)
+
+            elapsed = max(result[1] for result in results) - min(result[0] for result in results)
+            operations = sum(result[2] for result in results)
+            self.throughputTable.setdefault(operation, {})[clients] = operations / elapsed if elapsed else 0.0
+            if self.resultsStore is not None:
+                datasetHash, codeVersion, datasetSize = self.databaseVersion
+                latencies = [(end - start) / transactions for start, end, _ in results]
+                result = {'samples': len(latencies), 'mean': statistics.fmean(latencies), 'stddev': statistics.stdev(latencies) if len(latencies) > 1 else 0.0, 'halfWidth': 0.0, 'throughput': self.throughputTable[operation][clients]}
+                self.resultsStore.save(self.runId, self.databaseName, f'concurrent_{operation}', recordsPerTransaction, datasetHash, codeVersion, result, datasetSize=datasetSize, clients=clients)
+        return self.throughputTable[operation]
+
+    def drawGraphs(self):
+        for operation, throughputs in self.throughputTable.items():
+            clientCounts = sorted(throughputs)
+            plt.plot(clientCounts, [throughputs[clients] for clients in clientCounts], marker='o', label=operation)
+        plt.xscale('log', base=2)
+        plt.title(f'{self.databaseName} throughput with {self.workerKind.value} workers.')
+        plt.xlabel('Number of concurrent clients')
+        plt.ylabel('Throughput (records per second)')
+        plt.legend()
+        plt.show()
+
+    def getThroughputTable(self):
+        return self.throughputTable
\ No newline at end of file
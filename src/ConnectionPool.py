@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+class ConnectionPool:
+    def __init__(self, connect: Callable[[], object], size: int = 4, healthCheck: Callable[[object], None] = None, reset: Callable[[object], None] = None,
+                 close: Callable[[object], None] = lambda connection: connection.close(), warmup: bool = True, acquireTimeout: float = 30.0):
+        self.connect = connect
+        self.size = size
+        self.healthCheck = healthCheck
+        self.reset = reset
+        self.closeConnection = close
+        self.acquireTimeout = acquireTimeout
+        self.lock = threading.Lock()
+        self.state = {"idle": queue.LifoQueue(), "created": 0}
+        self.reconnects = 0
+        self.overflows = 0
+        self.acquireLatency = LatencyHistogram()
+        if warmup:
+            self.warmup()
+
+    def _state(self, connection=None) -> Dict[str, object]:
+        return self.state
+
+    def _adopt(self, connection):
+        return connection
+
+    def _disown(self, connection):
+        pass
+
+    def _exhausted(self, timeout: float = None):
+        try:
+            return self._state()["idle"].get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Connection pool exhausted: all {self.size} connections still in use after {timeout}s")
+
+    def _reserve(self) -> bool:
+        state = self._state()
+        with self.lock:
+            if state["created"] >= self.size:
+                return False
+            state["created"] += 1
+            return True
+
+    def __close(self, connection):
+        try:
+            self.closeConnection(connection)
+        except Exception:
+            pass
+
+    def __discard(self, connection):
+        state = self._state(connection)
+        self._disown(connection)
+        with self.lock:
+            state["created"] -= 1
+        self.__close(connection)
+
+    def warmup(self):
+        connections = []
+        while self._reserve():
+            connections.append(self._adopt(self.connect()))
+        for connection in connections:
+            if self.healthCheck is not None:
+                self.healthCheck(connection)
+            self._state()["idle"].put(connection)
+
+    def acquire(self, timeout: float = None):
+        start = time.perf_counter_ns()
+        try:
+            connection = self._state()["idle"].get_nowait()
+        except queue.Empty:
+            connection = self._adopt(self.connect()) if self._reserve() else self._exhausted(self.acquireTimeout if timeout is None else timeout)
+        if self.healthCheck is not None:
+            try:
+                self.healthCheck(connection)
+            except Exception:
+                self._disown(connection)
+                self.__close(connection)
+                self.reconnects += 1
+                connection = self._adopt(self.connect())
+        self.acquireLatency.record(time.perf_counter_ns() - start)
+        return connection
+
+    def release(self, connection):
+        state = self._state(connection)
+        if self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                self.__discard(connection)
+                return
+        if state["created"] > self.size:
+            self.__discard(connection)
+            return
+        state["idle"].put(connection)
+
+    @contextmanager
+    def connection(self, timeout: float = None) -> Iterator[object]:
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def getAcquireLatency(self) -> Dict[str, float]:
+        summary = self.acquireLatency.summary()
+        summary['reconnects'] = self.reconnects
+        summary['overflows'] = self.overflows
+        return summary
+
+    def close(self):
+        idle = self._state()["idle"]
+        while True:
+            try:
+                connection = idle.get_nowait()
+            except queue.Empty:
+                break
+            self.__discard(connection)
+
+class ThreadLocalConnectionPool(ConnectionPool):
+    def __init__(self, *args, **kwargs):
+        self.local = threading.local()
+        self.owners = {}
+        super().__init__(*args, **kwargs)
+
+    def _state(self, connection=None) -> Dict[str, object]:
+        if connection is not None:
+            return self.owners[id(connection)]
+        if not hasattr(self.local, "state"):
+            self.local.state = {"idle": queue.LifoQueue(), "created": 0}
+        return self.local.state
+
+    def _adopt(self, connection):
+        self.owners[id(connection)] = self._state()
+        return connection
+
+    def _disown(self, connection):
+        self.owners.pop(id(connection), None)
+
+    def _exhausted(self, timeout: float = None):
+        with self.lock:
+            self._state()["created"] += 1
+            self.overflows += 1
+        return self._adopt(self.connect())
\ No newline at end of file
@@ -0,0 +1,66 @@
+import csv
+import mmap
+import os
+from array import array
+from datetime import datetime
+from typing import Iterator, List, Tuple
+
+Row = Tuple[datetime, datetime, float, int]
+
+class CsvDataset:
+    def __init__(self, file_path: str, delimiter: str = "|"):
+        self.file_path = file_path
+        self.name = os.path.splitext(os.path.basename(file_path))[0]
+        self.delimiter = delimiter
+        self.__file = open(file_path, "rb")
+        self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = self.__mmap.find(b"\n")
+        if header_end == -1:
+            header_end = len(self.__mmap)
+        self.column_names = next(csv.reader([self.__mmap[:header_end].decode().rstrip("\r")], delimiter=delimiter))
+        self.__line_offsets = self.__index_lines(header_end + 1)
+
+    def __index_lines(self, position: int) -> array:
+        offsets = array("q")
+        size = len(self.__mmap)
+        while position < size:
+            line_end = self.__mmap.find(b"\n", position)
+            if line_end == -1:
+                line_end = size
+            if line_end > position and self.__mmap[position:line_end].strip():
+                offsets.append(position)
+            position = line_end + 1
+        offsets.append(size)
+        return offsets
+
+    @staticmethod
+    def __convert_timestamp(timestamp_string: str) -> datetime:
+        return datetime.fromisoformat(timestamp_string.strip().replace(",", "."))
+
+    def __convert_row(self, row: List[str]) -> Row:
+        return self.__convert_timestamp(row[0]), self.__convert_timestamp(row[1]), float(row[2]), int(row[3])
+
+    def __len__(self) -> int:
+        return len(self.__line_offsets) - 1
+
+    def rows(self, start: int, stop: int) -> List[Row]:
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        chunk = self.__mmap[self.__line_offsets[start]:self.__line_offsets[stop]].decode()
+        reader = csv.reader((line for line in chunk.splitlines() if line.strip()), delimiter=self.delimiter)
+        return [self.__convert_row(row) for row in reader]
+
+    def batches(self, batch_size: int, start: int = 0) -> Iterator[List[Row]]:
+        for batch_start in range(start, len(self), batch_size):
+            yield self.rows(batch_start, batch_start + batch_size)
+
+    def close(self):
+        if not self.__mmap.closed:
+            self.__mmap.close()
+            self.__file.close()
+
+    def __del__(self):
+        self.close()
\ No newline at end of file
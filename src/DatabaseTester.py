@@ -1,60 +1,110 @@
-from typing import List, Dict
-import timeit
+from typing import List, Dict, Tuple
+import math
 import matplotlib.pyplot as plt
 import numpy as np
 
 class DatabaseTester:
-    def __init__(self, databaseList: List[DatabaseTestingInterface]):
+    def __init__(self, databaseList: List[DatabaseTestingInterface], runner: BenchmarkRunner = None, resultsStore: ResultsStore = None, maxResultAge: float = None, runId: str = None, sampleResources: bool = True, traceAllocations: bool = False, profileDirectory: str = None):
         self.databaseList = databaseList
+        self.databaseNames = [database.getName() for database in databaseList]
+        self.runner = runner or BenchmarkRunner()
+        self.resultsStore = resultsStore
+        self.maxResultAge = maxResultAge
+        self.runId = runId or datetime.now().isoformat(timespec='seconds')
+        self.sampleResources = sampleResources
+        self.traceAllocations = traceAllocations
+        self.profileDirectory = profileDirectory
         self.executionTimeTable: List[List[Dict[int, float]]] = [[], [], [], []]
         for methodIndex in range(4):
             for _ in databaseList:
                 self.executionTimeTable[methodIndex].append({})
+        self.recordCounts: List[int] = [None, None, None, None]
+        self.createThroughputTable: List[Dict[InsertMode, Dict[int, float]]] = [{} for _ in databaseList]
+        self.readThroughputTable: List[Dict[ReadMode, Dict[int, Tuple[float, float]]]] = [{} for _ in databaseList]
+        self.durabilityThroughputTable: List[Dict[DurabilityProfile, Dict[str, Dict[int, float]]]] = [{} for _ in databaseList]
+        self.latencyHistograms: Dict[Tuple[str, str, int], LatencyHistogram] = {}
+        self.benchmarkResults: Dict[Tuple[str, str, int], Dict[str, float]] = {}
+        self.resourceUsage: Dict[Tuple[str, str, int], Dict[str, float]] = {}
+        self.profileBreakdown: Dict[Tuple[str, str, int], Dict[str, float]] = {}
+
+    def __run(self, database: DatabaseTestingInterface, operation: str, recordsPerTransaction: int, insertMode: InsertMode = InsertMode.ROW, operationName: str = None, readMode: ReadMode = ReadMode.LIMIT, tableSize: int = None) -> Dict[str, float]:
+        key = (database.getName(), operationName or operation, recordsPerTransaction)
+        tableSize = self.runner.getTableSize(database, operation, recordsPerTransaction, tableSize)
+        if self.resultsStore is not None and self.profileDirectory is None:
+            datasetHash, codeVersion = database.getDatasetHash(), database.getCodeVersion(self.runner.getSettings())
+            stored = self.resultsStore.load(*key, datasetHash, codeVersion, self.maxResultAge, runId=self.runId, datasetSize=tableSize)
+            if stored is not None:
+                self.benchmarkResults[key], histogram = stored
+                if histogram is not None:
+                    self.latencyHistograms[key] = histogram
+                return self.benchmarkResults[key]
+
+        histogram = LatencyHistogram()
+        sampler = ResourceSampler(database.getServerProcessNames(), traceAllocations=self.traceAllocations) if self.sampleResources else None
+        profiler = OperationProfiler(self.profileDirectory) if self.profileDirectory is not None else None
+        result = self.runner.run(database, operation, recordsPerTransaction, histogram, insertMode, tableSize, readMode=readMode, sampler=sampler, profiler=profiler)
+        if profiler is not None:
+            self.profileBreakdown[key] = profiler.breakdown()
+            profiler.export(*key)
+        self.latencyHistograms[key] = histogram
+        if 'resources' in result:
+            self.resourceUsage[key] = result['resources']
+        self.benchmarkResults[key] = result
+        if self.resultsStore is not None and self.profileDirectory is None:
+            self.resultsStore.save(self.runId, *key, datasetHash, codeVersion, result, histogram, tableSize)
+        return result
+
+    @staticmethod
+    def __totalTime(result: Dict[str, float], records: int, recordsPerTransaction: int) -> float:
+        return result['mean'] * math.ceil(records / recordsPerTransaction)
 
     def testCreate(self, createdRecords: int = 1, recordsPerTransaction: int = 1):
         for databaseIndex, database in enumerate(self.databaseList):
-            def prepeareCreate():
-                database.reset()
-            total_time = 0
-            for currentRecord in range(0, createdRecords, recordsPerTransaction):
-                total_time += timeit.timeit(lambda: database.create(min(recordsPerTransaction, createdRecords - recordsPerTransaction)), lambda: prepeareCreate(), number=10)
-            self.executionTimeTable[0][databaseIndex][recordsPerTransaction] = total_time
-
-    def testRead(self, readRecords: int = 1, recordsPerTransaction: int = 1):
+            for insertMode in database.getInsertModes():
+                operationName = 'create' if insertMode == InsertMode.ROW else f'create_{insertMode.value}'
+                result = self.__run(database, 'create', recordsPerTransaction, insertMode, operationName)
+                if insertMode == InsertMode.ROW:
+                    self.executionTimeTable[0][databaseIndex][recordsPerTransaction] = self.__totalTime(result, createdRecords, recordsPerTransaction)
+                    self.recordCounts[0] = createdRecords
+                self.createThroughputTable[databaseIndex].setdefault(insertMode, {})[recordsPerTransaction] = result['throughput']
+
+    def testRead(self, readRecords: int = 1, recordsPerTransaction: int = 1, readMode: ReadMode = ReadMode.LIMIT):
         for databaseIndex, database in enumerate(self.databaseList):
-            if database.getName() == 'Cassandra' and recordsPerTransaction > 1:
-                continue
-            database.reset()
-            database.create(readRecords)
-            total_time = 0
-            for currentRecord in range(0, readRecords, recordsPerTransaction):
-                total_time += timeit.timeit(lambda: database.read(min(recordsPerTransaction, readRecords - recordsPerTransaction)), number=10)
-            self.executionTimeTable[1][databaseIndex][recordsPerTransaction] = total_time
+            operationName = 'read' if readMode == ReadMode.LIMIT else f'read_{readMode.value}'
+            if readMode != ReadMode.STREAM and readMode in database.getScanReadModes():
+                operationName += '_scan'
+            result = self.__run(database, 'read', recordsPerTransaction, operationName=operationName, readMode=readMode, tableSize=readRecords)
+            if readMode == ReadMode.LIMIT:
+                self.executionTimeTable[1][databaseIndex][recordsPerTransaction] = self.__totalTime(result, readRecords, recordsPerTransaction)
+                self.recordCounts[1] = readRecords
+            self.readThroughputTable[databaseIndex].setdefault(readMode, {})[recordsPerTransaction] = (result['throughput'], result['bytesPerSecond'])
 
     def testUpdate(self, updatedRecords: int = 1, recordsPerTransaction: int = 1):
         for databaseIndex, database in enumerate(self.databaseList):
-            def prepeareUpdate():
-                database.reset()
-                database.create(recordsPerTransaction)
-            total_time = 0
-            for currentRecord in range(0, updatedRecords, recordsPerTransaction):
-                total_time += timeit.timeit(lambda: database.update(min(recordsPerTransaction, updatedRecords - recordsPerTransaction)), lambda: prepeareUpdate(), number=10)
-            self.executionTimeTable[2][databaseIndex][recordsPerTransaction] = total_time
+            result = self.__run(database, 'update', recordsPerTransaction, tableSize=updatedRecords)
+            self.executionTimeTable[2][databaseIndex][recordsPerTransaction] = self.__totalTime(result, updatedRecords, recordsPerTransaction)
+            self.recordCounts[2] = updatedRecords
 
     def tesetDelete(self, deletedRecords: int = 1, recordsPerTransaction: int = 1):
         for databaseIndex, database in enumerate(self.databaseList):
-            def prepeareDelete():
-                database.reset()
-                database.create(recordsPerTransaction)
-            total_time = 0
-            for currentRecord in range(0, deletedRecords, recordsPerTransaction):
-                total_time += timeit.timeit(lambda: database.delete(min(recordsPerTransaction, deletedRecords - recordsPerTransaction)), lambda: prepeareDelete(), number=10)
-            self.executionTimeTable[3][databaseIndex][recordsPerTransaction] = total_time
+            result = self.__run(database, 'delete', recordsPerTransaction, tableSize=deletedRecords)
+            self.executionTimeTable[3][databaseIndex][recordsPerTransaction] = self.__totalTime(result, deletedRecords, recordsPerTransaction)
+            self.recordCounts[3] = deletedRecords
+
+    def testDurability(self, recordsPerTransaction: int = 1, operations: List[str] = ['create', 'update', 'delete']):
+        for databaseIndex, database in enumerate(self.databaseList):
+            originalProfile = database.getDurabilityProfile()
+            for durabilityProfile in database.getDurabilityProfiles():
+                database.setDurabilityProfile(durabilityProfile)
+                for operation in operations:
+                    result = self.__run(database, operation, recordsPerTransaction)
+                    self.durabilityThroughputTable[databaseIndex].setdefault(durabilityProfile, {}).setdefault(operation, {})[recordsPerTransaction] = result['throughput']
+            database.setDurabilityProfile(originalProfile)
 
     def drawGraphs(self):
         methodName = ['creating', 'reading', 'updating', 'deleting']
         for methodIndex, method in enumerate(self.executionTimeTable):
-            labels = [database.getName() for database in self.databaseList]
+            labels = self.databaseNames
             names = [x.__str__() for x in method[0].keys().__reversed__()]
             bar_width = 0.2
             bar_shift = bar_width
@@ -69,12 +119,166 @@ class DatabaseTester:
                 plt.bar([xi + shift for xi in x], y, width=bar_width, label=labels[i])
 
             plt.xticks(x, names)
-            plt.title(f'Time elapsed while {methodName[methodIndex]} a 1000 records.')
+            plt.title(f'Time elapsed while {methodName[methodIndex]} {self.recordCounts[methodIndex]} records.')
             plt.xlabel('Number of records per transaction')
             plt.ylabel('Elapsed Time (seconds)')
             plt.legend()
             plt.show()
 
+        if self.latencyHistograms:
+            self.drawLatencyGraphs()
+        if self.resourceUsage:
+            self.drawResourceGraphs()
+
+    def drawLatencyGraphs(self, percentiles: List[str] = ['p50', 'p99', 'p99.9']):
+        latencyTable = self.getLatencyTable()
+        lineStyles = ['-', '--', ':', '-.']
+        for operation in sorted({key[1] for key in latencyTable}):
+            for databaseName in sorted({key[0] for key in latencyTable if key[1] == operation}):
+                batchSizes = sorted(key[2] for key in latencyTable if key[0] == databaseName and key[1] == operation)
+                for percentileIndex, percentile in enumerate(percentiles):
+                    y = [latencyTable[(databaseName, operation, batchSize)][percentile] * 1000 for batchSize in batchSizes]
+                    plt.plot(batchSizes, y, linestyle=lineStyles[percentileIndex % len(lineStyles)], marker='o', label=f'{databaseName} {percentile}')
+            plt.xscale('log')
+            plt.yscale('log')
+            plt.title(f'Latency percentiles of {operation} transactions.')
+            plt.xlabel('Number of records per transaction')
+            plt.ylabel('Latency (milliseconds)')
+            plt.legend()
+            plt.show()
+
+    def drawResourceGraphs(self):
+        lineStyles = {'clientCpu': '-', 'serverCpu': '--'}
+        for operation in sorted({key[1] for key in self.resourceUsage}):
+            for databaseName in sorted({key[0] for key in self.resourceUsage if key[1] == operation}):
+                batchSizes = sorted(key[2] for key in self.resourceUsage if key[0] == databaseName and key[1] == operation)
+                for metric, lineStyle in lineStyles.items():
+                    y = [self.resourceUsage[(databaseName, operation, batchSize)][metric] / self.resourceUsage[(databaseName, operation, batchSize)]['elapsed'] * 100 for batchSize in batchSizes]
+                    plt.plot(batchSizes, y, linestyle=lineStyle, marker='o', label=f'{databaseName} {metric}')
+            plt.xscale('log')
+            plt.title(f'CPU utilisation while benchmarking {operation} transactions.')
+            plt.xlabel('Number of records per transaction')
+            plt.ylabel('CPU time per wall-clock time (%)')
+            plt.legend()
+            plt.show()
+
+            for databaseName in sorted({key[0] for key in self.resourceUsage if key[1] == operation}):
+                batchSizes = sorted(key[2] for key in self.resourceUsage if key[0] == databaseName and key[1] == operation)
+                y = [(self.resourceUsage[(databaseName, operation, batchSize)]['clientWriteBytes'] + self.resourceUsage[(databaseName, operation, batchSize)]['serverWriteBytes']) / 2 ** 20 for batchSize in batchSizes]
+                plt.plot(batchSizes, y, marker='o', label=databaseName)
+            plt.xscale('log')
+            plt.title(f'Bytes written to disk while benchmarking {operation} transactions.')
+            plt.xlabel('Number of records per transaction')
+            plt.ylabel('Written (MiB)')
+            plt.legend()
+            plt.show()
+
+    def drawProfileGraphs(self):
+        keys = sorted(self.profileBreakdown)
+        bottom = [0.0] * len(keys)
+        for category in TimeCategory:
+            y = [self.profileBreakdown[key][category.value] / max(sum(self.profileBreakdown[key].values()), 1e-12) * 100 for key in keys]
+            plt.barh([f'{name} {operation} {batchSize}' for name, operation, batchSize in keys], y, left=bottom, label=category.value)
+            bottom = [left + width for left, width in zip(bottom, y)]
+        plt.title('Share of profiled time by category.')
+        plt.xlabel('Share of profiled time (%)')
+        plt.legend()
+        plt.show()
+
+    def getProfileBreakdown(self) -> Dict[Tuple[str, str, int], Dict[str, float]]:
+        return self.profileBreakdown
+
+    def getResourceUsage(self) -> Dict[Tuple[str, str, int], Dict[str, float]]:
+        return self.resourceUsage
+
+    def getLatencyTable(self) -> Dict[Tuple[str, str, int], Dict[str, float]]:
+        latencyTable = {}
+        for (databaseName, operation, recordsPerTransaction), histogram in self.latencyHistograms.items():
+            summary = histogram.summary()
+            if (databaseName, operation, recordsPerTransaction) in self.benchmarkResults:
+                summary['throughput'] = self.benchmarkResults[(databaseName, operation, recordsPerTransaction)]['throughput']
+            else:
+                summary['throughput'] = histogram.count * recordsPerTransaction * 1e9 / histogram.total if histogram.total else 0.0
+            latencyTable[(databaseName, operation, recordsPerTransaction)] = summary
+        return latencyTable
+
+    def drawCreateThroughputGraphs(self):
+        for databaseIndex, databaseName in enumerate(self.databaseNames):
+            modeTable = self.createThroughputTable[databaseIndex]
+            if not modeTable:
+                continue
+            batchSizes = sorted({batchSize for throughputs in modeTable.values() for batchSize in throughputs})
+            bar_width = 0.8 / len(modeTable)
+            x = np.arange(len(batchSizes))
+
+            for i, (insertMode, throughputs) in enumerate(modeTable.items()):
+                y = [throughputs.get(batchSize, 0.0) for batchSize in batchSizes]
+                plt.bar([xi + (i - (len(modeTable) - 1) / 2) * bar_width for xi in x], y, width=bar_width, label=insertMode.value)
+
+            plt.xticks(x, [str(batchSize) for batchSize in batchSizes])
+            plt.title(f'{databaseName} insert throughput by insert mode.')
+            plt.xlabel('Number of records per transaction')
+            plt.ylabel('Throughput (records per second)')
+            plt.legend()
+            plt.show()
+
+    def drawDurabilityGraphs(self):
+        for databaseIndex, databaseName in enumerate(self.databaseNames):
+            profileTable = self.durabilityThroughputTable[databaseIndex]
+            if not profileTable:
+                continue
+            operations = sorted({operation for throughputs in profileTable.values() for operation in throughputs})
+            bar_width = 0.8 / len(operations)
+            x = np.arange(len(profileTable))
+
+            for i, operation in enumerate(operations):
+                y = [max(profileTable[profile].get(operation, {0: 0.0}).values()) for profile in profileTable]
+                plt.bar([xi + (i - (len(operations) - 1) / 2) * bar_width for xi in x], y, width=bar_width, label=operation)
+
+            plt.xticks(x, [profile.value for profile in profileTable])
+            plt.yscale('log')
+            plt.title(f'{databaseName} write throughput by durability profile.')
+            plt.xlabel('Durability profile')
+            plt.ylabel('Throughput (records per second)')
+            plt.legend()
+            plt.show()
+
+    def getDurabilityThroughputTable(self):
+        return self.durabilityThroughputTable
+
+    def getBenchmarkResults(self) -> Dict[Tuple[str, str, int], Dict[str, float]]:
+        return self.benchmarkResults
+
+    def getReadThroughputTable(self):
+        return self.readThroughputTable
+
+    def getCreateThroughputTable(self):
+        return self.createThroughputTable
+
+    def exportResults(self) -> Dict[str, object]:
+        return {
+            'databaseNames': self.databaseNames,
+            'recordCounts': self.recordCounts,
+            'executionTimeTable': self.executionTimeTable,
+            'createThroughputTable': self.createThroughputTable,
+            'readThroughputTable': self.readThroughputTable,
+            'durabilityThroughputTable': self.durabilityThroughputTable,
+            'latencyHistograms': self.latencyHistograms,
+            'benchmarkResults': self.benchmarkResults,
+            'resourceUsage': self.resourceUsage,
+            'profileBreakdown': self.profileBreakdown
+        }
+
+    def importResults(self, results: Dict[str, object]):
+        self.databaseNames = self.databaseNames + results['databaseNames']
+        self.recordCounts = [count if count is not None else self.recordCounts[methodIndex] for methodIndex, count in enumerate(results['recordCounts'])]
+        for methodIndex in range(4):
+            self.executionTimeTable[methodIndex].extend(results['executionTimeTable'][methodIndex])
+        for table in ('createThroughputTable', 'readThroughputTable', 'durabilityThroughputTable'):
+            getattr(self, table).extend(results[table])
+        for table in ('latencyHistograms', 'benchmarkResults', 'resourceUsage', 'profileBreakdown'):
+            getattr(self, table).update(results[table])
+
     def setExecutionTimeTable(self, executionTimeTable):
         self.executionTimeTable = executionTimeTable
 
@@ -1,24 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Union
+from typing import Callable, List, Dict, Tuple, Union
 import csv
+import hashlib
 import itertools
 from datetime import datetime
+from enum import Enum
+
+class InsertMode(Enum):
+    ROW = "row"
+    BULK = "bulk"
+    COPY = "copy"
+    PARTITIONED = "partitioned"
+
+class ReadMode(Enum):
+    LIMIT = "limit"
+    POINT = "point"
+    RANGE = "range"
+    STREAM = "stream"
+
+class SchemaProfile(Enum):
+    NONE = "none"
+    PRIMARY_KEY = "primary_key"
+    SECONDARY_INDEX = "secondary_index"
+    CLUSTERED = "clustered"
+    BRIN = "brin"
+
+class DurabilityProfile(Enum):
+    STRICT = "strict"
+    DEFAULT = "default"
+    RELAXED = "relaxed"
+    NONE = "none"
 
 class DatabaseTestingInterface (ABC):
     @abstractmethod
-    def create(self, rows_created: int = 1, transactions: int = 1):
+    def create(self, rows_created: int = 1, transactions: int = 1, insert_mode: InsertMode = InsertMode.ROW, offset: int = 0):
         pass
 
     @abstractmethod
-    def read(self, rows_read: int = 1, transactions: int = 1):
+    def read(self, rows_read: int = 1, transactions: int = 1, offset: int = 0, read_mode: ReadMode = ReadMode.LIMIT) -> int:
         pass
 
     @abstractmethod
-    def update(self, rows_updated: int = 1, transactions: int = 1):
+    def update(self, rows_updated: int = 1, transactions: int = 1, offset: int = 0):
         pass
 
     @abstractmethod
-    def delete(self, rows_deleted: int = 1, transactions: int = 1):
+    def delete(self, rows_deleted: int = 1, transactions: int = 1, offset: int = 0):
         pass
 
     @abstractmethod
@@ -27,4 +54,126 @@ class DatabaseTestingInterface (ABC):
 
     @abstractmethod
     def getName(self) -> str:
-        pass
\ No newline at end of file
+        pass
+
+    def truncate(self):
+        self.reset()
+
+    def prepareStatement(self, table_name: str, operation: str):
+        raise NotImplementedError(f"{type(self).__name__} does not prepare {operation} statements")
+
+    def getStatement(self, table_name: str, operation: str):
+        statements = self.__dict__.setdefault("statement_cache", {})
+        key = (table_name, operation)
+        if key not in statements:
+            statements[key] = self.prepareStatement(table_name, operation)
+        return statements[key]
+
+    def clearStatements(self):
+        self.__dict__.setdefault("statement_cache", {}).clear()
+
+    @staticmethod
+    def __result_bytes(value) -> int:
+        if value is None:
+            return 0
+        if isinstance(value, str):
+            return len(value.encode())
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        if isinstance(value, dict):
+            return sum(len(key) + DatabaseTestingInterface.__result_bytes(item) for key, item in value.items())
+        if isinstance(value, (tuple, list)):
+            return sum(map(DatabaseTestingInterface.__result_bytes, value))
+        if hasattr(value, "binary"):
+            return len(value.binary)
+        return 8
+
+    def countRows(self, rows: List) -> int:
+        if self.__dict__.get("result_bytes") is not None:
+            self.result_bytes += self.__result_bytes(rows)
+        return len(rows)
+
+    def measureResultBytes(self, read: Callable[[], int]) -> Tuple[int, int]:
+        self.result_bytes = 0
+        try:
+            return read(), self.result_bytes
+        finally:
+            self.result_bytes = None
+
+    def getScanReadModes(self) -> List[ReadMode]:
+        if self.__dict__.get("schema_profile", SchemaProfile.NONE) == SchemaProfile.NONE:
+            return [ReadMode.POINT, ReadMode.RANGE, ReadMode.STREAM]
+        return [ReadMode.STREAM]
+
+    def prepareRows(self, start: int, stop: int):
+        for dataset in self.datasets.values():
+            dataset.prepare(start, stop)
+
+    def releaseRows(self, start: int, stop: int):
+        for dataset in self.datasets.values():
+            dataset.release(start, stop)
+
+    def getDatasetSize(self) -> int:
+        return min((len(dataset) for dataset in self.datasets.values()), default=0)
+
+    def getDatasetHash(self) -> str:
+        digest = hashlib.sha1()
+        for name in sorted(self.datasets):
+            digest.update(f"{name}:{self.datasets[name].fingerprint()};".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def __hash_code(digest, code):
+        digest.update(code.co_code)
+        digest.update(repr((code.co_names, code.co_varnames)).encode())
+        for constant in code.co_consts:
+            if hasattr(constant, "co_code"):
+                DatabaseTestingInterface.__hash_code(digest, constant)
+            else:
+                digest.update(repr(constant).encode())
+
+    def getCodeVersion(self, settings: Tuple = ()) -> str:
+        digest = hashlib.sha1(repr((self.getSoftwareVersions(), settings)).encode())
+        for cls in type(self).__mro__:
+            if cls in (ABC, object):
+                continue
+            for name in sorted(vars(cls)):
+                member = vars(cls)[name]
+                code = getattr(getattr(member, "__func__", member), "__code__", None)
+                if code is not None:
+                    digest.update(name.encode())
+                    DatabaseTestingInterface.__hash_code(digest, code)
+        return digest.hexdigest()
+
+    def getInsertModes(self) -> List[InsertMode]:
+        return [InsertMode.ROW, InsertMode.BULK]
+
+    def getSchemaProfiles(self) -> List[SchemaProfile]:
+        return [SchemaProfile.NONE]
+
+    def getDurabilityProfiles(self) -> List[DurabilityProfile]:
+        return [DurabilityProfile.DEFAULT]
+
+    def getDurabilityProfile(self) -> DurabilityProfile:
+        return self.__dict__.get("durability_profile", DurabilityProfile.DEFAULT)
+
+    def setDurabilityProfile(self, durability_profile: DurabilityProfile):
+        if durability_profile not in self.getDurabilityProfiles():
+            raise ValueError(f"Durability profile {durability_profile.value} is not supported by {type(self).__name__}")
+        self.durability_profile = durability_profile
+
+    def getConfiguration(self) -> List[str]:
+        durability_profile = self.getDurabilityProfile()
+        return [] if durability_profile == DurabilityProfile.DEFAULT else [f"durability={durability_profile.value}"]
+
+    def getServerProcessNames(self) -> List[str]:
+        return []
+
+    def getSoftwareVersions(self) -> List[str]:
+        return []
+
+    def supportsAsync(self) -> bool:
+        return False
+
+    async def executeAsync(self, operation: str, rows: int = 1, transactions: int = 1, offset: int = 0):
+        raise NotImplementedError(f"{type(self).__name__} has no asynchronous driver path")
\ No newline at end of file
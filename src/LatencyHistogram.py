@@ -0,0 +1,86 @@
+import zlib
+from array import array
+from typing import Dict
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+    MAX_SHIFT = 40
+    PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * (self.SUB_BUCKET_COUNT + self.MAX_SHIFT * self.SUB_BUCKET_HALF)))
+        self.count = 0
+        self.total = 0
+        self.minimum = 0
+        self.maximum = 0
+
+    def __bucket_index(self, value: int) -> int:
+        if value < self.SUB_BUCKET_COUNT:
+            return value
+        shift = min(value.bit_length() - self.SUB_BUCKET_BITS, self.MAX_SHIFT)
+        mantissa = min(value >> shift, self.SUB_BUCKET_COUNT - 1)
+        return self.SUB_BUCKET_COUNT + (shift - 1) * self.SUB_BUCKET_HALF + mantissa - self.SUB_BUCKET_HALF
+
+    def __bucket_upper_bound(self, index: int) -> int:
+        if index < self.SUB_BUCKET_COUNT:
+            return index
+        shift = (index - self.SUB_BUCKET_COUNT) // self.SUB_BUCKET_HALF + 1
+        mantissa = (index - self.SUB_BUCKET_COUNT) % self.SUB_BUCKET_HALF + self.SUB_BUCKET_HALF
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int):
+        self.counts[self.__bucket_index(value)] += 1
+        if self.count == 0 or value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LatencyHistogram"):
+        if other.count == 0:
+            return
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        self.minimum = other.minimum if self.count == 0 else min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percentile: float) -> int:
+        if self.count == 0:
+            return 0
+        target = max(1, -(-self.count * percentile // 100))
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(max(self.__bucket_upper_bound(index), self.minimum), self.maximum)
+        return self.maximum
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_bytes(self) -> bytes:
+        header = array("Q", (self.count, self.total, self.minimum, self.maximum))
+        return zlib.compress(header.tobytes() + self.counts.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LatencyHistogram":
+        values = array("Q")
+        values.frombytes(zlib.decompress(data))
+        histogram = cls()
+        histogram.count, histogram.total, histogram.minimum, histogram.maximum = values[:4]
+        histogram.counts[:] = values[4:4 + len(histogram.counts)]
+        return histogram
+
+    def summary(self) -> Dict[str, float]:
+        summary = {f"p{percentile:g}": self.percentile(percentile) / 1e9 for percentile in self.PERCENTILES}
+        summary["max"] = self.maximum / 1e9
+        summary["mean"] = self.mean() / 1e9
+        summary["count"] = self.count
+        return summary
\ No newline at end of file
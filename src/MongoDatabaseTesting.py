@@ -1,93 +1,178 @@
-from pymongo import MongoClient
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import pymongo
+from pymongo import MongoClient, ASCENDING, HASHED, WriteConcern
 from pymongo.operations import InsertOne, UpdateOne, DeleteOne
 
 class MongoDatabaseTesting(DatabaseTestingInterface):
-    def __init__(self, connection_string: str, csv_file_paths: List[str]):
-        self.client = MongoClient(connection_string)
-        self.csv_data = {}
+    DURABILITY_SETTINGS = {
+        DurabilityProfile.STRICT: {"w": "majority", "j": True},
+        DurabilityProfile.DEFAULT: {},
+        DurabilityProfile.RELAXED: {"w": 1, "j": False},
+        DurabilityProfile.NONE: {"w": 0}
+    }
+
+    def __init__(self, connection_string: str, csv_file_paths: List[str], schema_profile: SchemaProfile = SchemaProfile.NONE, durability_profile: DurabilityProfile = DurabilityProfile.DEFAULT, pool: ConnectionPool = None,
+                 sharded: bool = False, write_concurrency: int = 4):
+        if schema_profile not in self.getSchemaProfiles():
+            raise ValueError(f"Schema profile {schema_profile.value} is not supported by MongoDB")
+        self.schema_profile = schema_profile
+        self.pool = pool
+        self.client = pool.acquire() if pool is not None else MongoClient(connection_string)
+        self.sharded = sharded
+        self.write_concurrency = write_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=write_concurrency)
+        self.datasets = {}
         self.collection_names = []
         self.collection_column_names = {}
         self.DATABASE_NAME = "databasetesting"
+        self.setDurabilityProfile(durability_profile)
 
         for file_path in csv_file_paths:
-            collection_name = os.path.splitext(os.path.basename(file_path))[0]
-            self.collection_names.append(collection_name)
-            self.collection_column_names[collection_name], self.csv_data[collection_name] = self.__parse_csv_data(file_path)
+            dataset = load_dataset(file_path)
+            self.collection_names.append(dataset.name)
+            self.datasets[dataset.name] = dataset
+            self.collection_column_names[dataset.name] = list(dataset.column_names)
 
         self.__normalize_collection_column_names()
+        self.__create_indexes()
+
+    def __create_indexes(self):
+        if self.sharded:
+            self.client.admin.command("enableSharding", self.DATABASE_NAME)
+            for collection_name in self.collection_names:
+                self.client.admin.command("shardCollection", f"{self.DATABASE_NAME}.{collection_name}", key={self.collection_column_names[collection_name][0]: HASHED})
+        if self.schema_profile == SchemaProfile.NONE:
+            return
+        db = self.database
+        for collection_name in self.collection_names:
+            keys = [(self.collection_column_names[collection_name][0], ASCENDING), (self.collection_column_names[collection_name][1], ASCENDING)]
+            db[collection_name].create_index(keys, name=f"{collection_name}_keys", unique=self.schema_profile == SchemaProfile.PRIMARY_KEY)
 
     def __normalize_collection_column_names(self):
         for database_name, column_names in self.collection_column_names.items():
             column_names = [''.join(c for c in name.strip() if c.isalnum() or c == '_') for name in column_names]
             self.collection_column_names[database_name] = column_names
 
-    def __parse_csv_data(self, file_path: str) -> Tuple[List[str], List[Tuple[str, str, float, int]]]:
-        MAX_DATA_READ = 1000
-
-        with open(file_path, "r") as f:
-            reader = csv.reader(f, delimiter="|")
-            column_names = next(reader)
-            rows = itertools.islice(reader, MAX_DATA_READ)
-            data = []
-            for row in rows:
-                row[0] = row[0].replace(",", ".")
-                row[1] = row[1].replace(",", ".")
-                data.append(tuple(row))
-
-        return column_names, data
+    def __write_partitioned(self, collection, column_names: List[str], rows: RowSlice):
+        documents = [dict(zip(column_names, row)) for row in rows]
+        chunk_size = max(-(-len(documents) // self.write_concurrency), 1)
+        chunks = [documents[start:start + chunk_size] for start in range(0, len(documents), chunk_size)]
+        list(self.executor.map(lambda chunk: collection.insert_many(chunk, ordered=False), chunks))
 
-    def __convert_timestamp(self, timestamp_string: str):
-        return datetime.strptime(timestamp_string, '%Y-%m-%d %H:%M:%S.%f').timestamp()
-
-    def create(self, rows_created: int = 1, transactions: int = 1):
-        db = self.client[self.DATABASE_NAME]
-        for collection_name, data in self.csv_data.items():
+    def create(self, rows_created: int = 1, transactions: int = 1, insert_mode: InsertMode = InsertMode.ROW, offset: int = 0):
+        db = self.database
+        for collection_name, dataset in self.datasets.items():
             for transaction in range(transactions):
+                rows = dataset.rows(offset + transaction*rows_created, offset + (transaction+1)*rows_created)
+                if insert_mode == InsertMode.PARTITIONED:
+                    self.__write_partitioned(db[collection_name], self.collection_column_names[collection_name], rows)
+                    continue
+                if insert_mode != InsertMode.ROW:
+                    column_names = self.collection_column_names[collection_name]
+                    db[collection_name].insert_many([dict(zip(column_names, row)) for row in rows], ordered=False)
+                    continue
                 requests = []
-                for i in range(rows_created):
+                for row in rows:
                     requests.append(InsertOne({
-                        self.collection_column_names[collection_name][0]: self.__convert_timestamp(data[i][0]),
-                        self.collection_column_names[collection_name][1]: self.__convert_timestamp(data[i][1]),
-                        self.collection_column_names[collection_name][2]: data[i][2],
-                        self.collection_column_names[collection_name][3]: data[i][3]
+                        self.collection_column_names[collection_name][0]: row[0],
+                        self.collection_column_names[collection_name][1]: row[1],
+                        self.collection_column_names[collection_name][2]: row[2],
+                        self.collection_column_names[collection_name][3]: row[3]
                     }))
                 collection = db[collection_name]
                 collection.bulk_write(requests, ordered=False)
 
-    def read(self, rows_read: int = 1, transactions: int = 1):
-        for collection_name in self.collection_names:
-            db = self.client[self.DATABASE_NAME]
+    def read(self, rows_read: int = 1, transactions: int = 1, offset: int = 0, read_mode: ReadMode = ReadMode.LIMIT) -> int:
+        rows_fetched = 0
+        db = self.database
+        for collection_name, dataset in self.datasets.items():
             collection = db[collection_name]
+            column_names = self.collection_column_names[collection_name]
             for transaction in range(transactions):
-                collection.find().limit(rows_read).next()
+                rows = dataset.rows(offset + transaction*rows_read, offset + (transaction+1)*rows_read)
+                if read_mode == ReadMode.POINT:
+                    for row in rows:
+                        rows_fetched += self.countRows(list(collection.find({column_names[0]: row[0], column_names[1]: row[1]}).limit(1)))
+                    continue
+                if read_mode == ReadMode.RANGE:
+                    if not len(rows):
+                        continue
+                    first_timestamp, last_timestamp = rows.timestamp_range(0)
+                    cursor = collection.find({column_names[0]: {'$gte': first_timestamp, '$lte': last_timestamp}}).batch_size(rows_read)
+                elif read_mode == ReadMode.STREAM:
+                    cursor = collection.find().batch_size(rows_read)
+                else:
+                    rows_fetched += self.countRows(list(itertools.islice(collection.find().limit(rows_read), 1)))
+                    continue
+                for document in cursor:
+                    rows_fetched += self.countRows([document])
+        return rows_fetched
 
-    def update(self, rows_updated: int = 1, transactions: int = 1):
-        db = self.client[self.DATABASE_NAME]
-        for collection_name, data in self.csv_data.items():
+    def update(self, rows_updated: int = 1, transactions: int = 1, offset: int = 0):
+        db = self.database
+        for collection_name, dataset in self.datasets.items():
             for transaction in range(transactions):
                 requests = []
-                for i in range(rows_updated):
-                    requests.append(UpdateOne({self.collection_column_names[collection_name][0]: self.__convert_timestamp(self.csv_data[collection_name][i][0]), self.collection_column_names[collection_name][1]: self.__convert_timestamp(self.csv_data[collection_name][i][1])}, {'$set': {self.collection_column_names[collection_name][2]: 0}}))
+                for row in dataset.rows(offset + transaction*rows_updated, offset + (transaction+1)*rows_updated):
+                    requests.append(UpdateOne({self.collection_column_names[collection_name][0]: row[0], self.collection_column_names[collection_name][1]: row[1]}, {'$set': {self.collection_column_names[collection_name][2]: 0}}))
                 collection = db[collection_name]
                 collection.bulk_write(requests, ordered=False)
 
-    def delete(self, rows_deleted: int = 1, transactions: int = 1):
-        db = self.client[self.DATABASE_NAME]
-        for collection_name, data in self.csv_data.items():
+    def delete(self, rows_deleted: int = 1, transactions: int = 1, offset: int = 0):
+        db = self.database
+        for collection_name, dataset in self.datasets.items():
             for transaction in range(transactions):
                 requests = []
-                for i in range(rows_deleted):
-                    requests.append(DeleteOne({self.collection_column_names[collection_name][0]: self.__convert_timestamp(self.csv_data[collection_name][i][0]), self.collection_column_names[collection_name][1]: self.__convert_timestamp(self.csv_data[collection_name][i][1])}))
+                for row in dataset.rows(offset + transaction*rows_deleted, offset + (transaction+1)*rows_deleted):
+                    requests.append(DeleteOne({self.collection_column_names[collection_name][0]: row[0], self.collection_column_names[collection_name][1]: row[1]}))
                 collection = db[collection_name]
                 collection.bulk_write(requests, ordered=False)
 
     def reset(self):
-        db = self.client[self.DATABASE_NAME]
+        db = self.database
         for collection_name in self.collection_names:
             db[collection_name].drop()
+        self.__create_indexes()
+
+    def truncate(self):
+        db = self.database
+        for collection_name in self.collection_names:
+            db[collection_name].delete_many({})
 
     def getName(self) -> str:
-        return "MongoDB"
+        return " ".join(["MongoDB"] + self.getConfiguration())
+
+    def getSchemaProfiles(self) -> List[SchemaProfile]:
+        return [SchemaProfile.NONE, SchemaProfile.PRIMARY_KEY, SchemaProfile.SECONDARY_INDEX]
+
+    def getConfiguration(self) -> List[str]:
+        return ([] if self.schema_profile == SchemaProfile.NONE else [f"schema={self.schema_profile.value}"]) + (["sharded"] if self.sharded else []) + super().getConfiguration()
+
+    def getInsertModes(self) -> List[InsertMode]:
+        return [InsertMode.ROW, InsertMode.BULK, InsertMode.PARTITIONED]
+
+    def getDurabilityProfiles(self) -> List[DurabilityProfile]:
+        return [DurabilityProfile.STRICT, DurabilityProfile.DEFAULT, DurabilityProfile.RELAXED, DurabilityProfile.NONE]
+
+    def setDurabilityProfile(self, durability_profile: DurabilityProfile):
+        super().setDurabilityProfile(durability_profile)
+        self.database = self.client.get_database(self.DATABASE_NAME, write_concern=WriteConcern(**self.DURABILITY_SETTINGS[durability_profile]))
+
+    def getServerProcessNames(self) -> List[str]:
+        return ["mongod"]
+
+    def getSoftwareVersions(self) -> List[str]:
+        return [f"pymongo {pymongo.version}", f"server {self.client.server_info()['version']}"]
+
+    @staticmethod
+    def createPool(connection_string: str, size: int = 1, max_pool_size: int = 100, min_pool_size: int = 0, warmup: bool = True) -> ConnectionPool:
+        return ConnectionPool(lambda: MongoClient(connection_string, maxPoolSize=max_pool_size, minPoolSize=min_pool_size), size,
+                              healthCheck=lambda client: client.admin.command("ping"), warmup=warmup)
 
     def __del__(self):
-        self.client.close()
\ No newline at end of file
+        self.executor.shutdown()
+        if self.pool is not None:
+            self.pool.release(self.client)
+        else:
+            self.client.close()
\ No newline at end of file
@@ -0,0 +1,123 @@
+import cProfile
+import os
+import pstats
+import re
+import zlib
+from enum import Enum
+from html import escape
+from typing import Dict, List, Tuple
+
+class TimeCategory(Enum):
+    PAYLOAD = "payload preparation"
+    SERIALIZATION = "driver serialization"
+    WAIT = "network/server wait"
+    COMMIT = "commit"
+
+class OperationProfiler:
+    DRIVER_MODULES = ("psycopg2", "pymongo", "bson", "cassandra", "sqlite3")
+    WAIT_NAMES = ("execute", "fetch", "recv", "send", "poll", "select", "wait", "acquire", "copy_expert", "result")
+    MAX_DEPTH = 64
+    FRAME_HEIGHT = 16
+    WIDTH = 1200
+
+    def __init__(self, outputDirectory: str = "profiles"):
+        self.outputDirectory = outputDirectory
+        self.profile = cProfile.Profile()
+
+    @staticmethod
+    def __label(function: Tuple[str, int, str]) -> str:
+        fileName, line, name = function
+        if fileName == "~":
+            return name
+        return f"{name} ({os.path.basename(fileName)}:{line})"
+
+    def __categorize(self, function: Tuple[str, int, str]) -> TimeCategory:
+        fileName, _, name = function
+        if "commit" in name:
+            return TimeCategory.COMMIT
+        if fileName == "~" and any(waitName in name for waitName in self.WAIT_NAMES):
+            return TimeCategory.WAIT
+        if any(module in fileName or module in name for module in self.DRIVER_MODULES):
+            return TimeCategory.SERIALIZATION
+        return TimeCategory.PAYLOAD
+
+    def breakdown(self) -> Dict[str, float]:
+        breakdown = {category.value: 0.0 for category in TimeCategory}
+        for function, (_, _, selfTime, _, _) in pstats.Stats(self.profile).stats.items():
+            breakdown[self.__categorize(function).value] += selfTime
+        return breakdown
+
+    def collapsedStacks(self) -> Dict[str, float]:
+        stats = pstats.Stats(self.profile).stats
+        callees = {}
+        for function, (_, _, _, _, callers) in stats.items():
+            for caller, (_, _, _, cumulativeTime) in callers.items():
+                callees.setdefault(caller, []).append((function, cumulativeTime))
+        roots = [function for function, entry in stats.items() if not any(caller in stats for caller in entry[4])]
+
+        stacks = {}
+
+        def walk(function, path, scale):
+            _, _, selfTime, cumulativeTime, _ = stats[function]
+            path = path + [self.__label(function)]
+            if selfTime * scale > 0:
+                stack = ";".join(path)
+                stacks[stack] = stacks.get(stack, 0.0) + selfTime * scale
+            if len(path) >= self.MAX_DEPTH or cumulativeTime <= 0:
+                return
+            for callee, edgeTime in callees.get(function, []):
+                if callee in stats and self.__label(callee) not in path:
+                    calleeTime = stats[callee][3]
+                    if calleeTime > 0:
+                        walk(callee, path, scale * edgeTime / calleeTime)
+
+        for root in roots:
+            walk(root, [], 1.0)
+        return stacks
+
+    def __flameGraph(self, stacks: Dict[str, float], title: str) -> str:
+        tree = {"children": {}, "time": 0.0}
+        for stack, time in stacks.items():
+            node = tree
+            node["time"] += time
+            for frame in stack.split(";"):
+                node = node["children"].setdefault(frame, {"children": {}, "time": 0.0})
+                node["time"] += time
+
+        rectangles = []
+        depth = [0]
+
+        def draw(node, x, level):
+            depth[0] = max(depth[0], level)
+            for frame, child in sorted(node["children"].items()):
+                width = child["time"] / tree["time"] * self.WIDTH if tree["time"] else 0.0
+                if width >= 0.5:
+                    rectangles.append((x, level, width, frame, child["time"]))
+                    draw(child, x, level + 1)
+                x += width
+
+        draw(tree, 0.0, 0)
+        height = (depth[0] + 2) * self.FRAME_HEIGHT
+        lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.WIDTH}" height="{height}" font-family="monospace" font-size="11">',
+                 f'<text x="4" y="12">{escape(title)}</text>']
+        for x, level, width, frame, time in rectangles:
+            y = height - (level + 1) * self.FRAME_HEIGHT
+            hue = 20 + zlib.crc32(frame.encode()) % 40
+            lines.append(f'<g><title>{escape(frame)} ({time * 1000:.3f} ms)</title>'
+                         f'<rect x="{x:.1f}" y="{y}" width="{width:.1f}" height="{self.FRAME_HEIGHT - 1}" fill="hsl({hue},90%,60%)"/>'
+                         f'<text x="{x + 2:.1f}" y="{y + 11}">{escape(frame[:int(width / 7)])}</text></g>')
+        lines.append('</svg>')
+        return "\n".join(lines)
+
+    def export(self, backend: str, operation: str, recordsPerTransaction: int) -> Tuple[str, str]:
+        os.makedirs(self.outputDirectory, exist_ok=True)
+        baseName = re.sub(r"[^\w.-]+", "_", f"{backend}_{operation}_{recordsPerTransaction}")
+        collapsedPath = os.path.join(self.outputDirectory, baseName + ".collapsed")
+        svgPath = os.path.join(self.outputDirectory, baseName + ".svg")
+        stacks = self.collapsedStacks()
+        with open(collapsedPath, "w") as file:
+            for stack, time in sorted(stacks.items()):
+                file.write(f"{stack} {round(time * 1e6)}\n")
+        with open(svgPath, "w") as file:
+            file.write(self.__flameGraph(stacks, f"{backend} {operation} with {recordsPerTransaction} records per transaction"))
+        return collapsedPath, svgPath
\ No newline at end of file
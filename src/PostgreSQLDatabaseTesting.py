@@ -1,22 +1,46 @@
+import io
 import psycopg2
+import psycopg2.extras
 
 class PostgresDatabaseTesting(DatabaseTestingInterface):
-    def __init__(self, connection_string: str, csv_file_paths: List[str]):
-        self.connection = psycopg2.connect(connection_string)
-        self.csv_data = {}
+    DURABILITY_SETTINGS = {
+        DurabilityProfile.STRICT: "remote_apply",
+        DurabilityProfile.DEFAULT: None,
+        DurabilityProfile.RELAXED: "local",
+        DurabilityProfile.NONE: "off"
+    }
+
+    def __init__(self, connection_string: str, csv_file_paths: List[str], create_schema: bool = True, schema_profile: SchemaProfile = SchemaProfile.NONE, durability_profile: DurabilityProfile = DurabilityProfile.DEFAULT, pool: ConnectionPool = None,
+                 commit_delay: int = None):
+        if schema_profile not in self.getSchemaProfiles():
+            raise ValueError(f"Schema profile {schema_profile.value} is not supported by PostgreSQL")
+        self.schema_profile = schema_profile
+        self.pool = pool
+        self.connection = pool.acquire() if pool is not None else psycopg2.connect(connection_string)
+        self.commit_delay = commit_delay
+        cursor = self.connection.cursor()
+        cursor.execute("SHOW synchronous_standby_names")
+        self.synchronous_standby = bool(cursor.fetchone()[0].strip())
+        self.connection.commit()
+        self.setDurabilityProfile(durability_profile)
+        self.datasets = {}
         self.table_names = []
         self.table_column_names = {}
 
         for file_path in csv_file_paths:
-            table_name = os.path.splitext(os.path.basename(file_path))[0]
-            self.table_names.append(table_name)
-            self.table_column_names[table_name], self.csv_data[table_name] = self.__parse_csv_data(file_path)
+            dataset = load_dataset(file_path)
+            self.table_names.append(dataset.name)
+            self.datasets[dataset.name] = dataset
+            self.table_column_names[dataset.name] = list(dataset.column_names)
 
         self.__normalize_table_column_names()
-        self.__create_tables()
+        if create_schema:
+            self.__create_tables()
 
     def __create_tables(self):
+        self.clearStatements()
         cursor = self.connection.cursor()
+        cursor.execute("DEALLOCATE ALL")
         for table_name in self.table_names:
             cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
             column_definitions = []
@@ -24,8 +48,15 @@ class PostgresDatabaseTesting(DatabaseTestingInterface):
             column_definitions.append(f"{self.table_column_names[table_name][1]} timestamp NOT NULL")
             column_definitions.append(f"{self.table_column_names[table_name][2]} numeric NOT NULL")
             column_definitions.append(f"{self.table_column_names[table_name][3]} integer")
+            key_columns = f"{self.table_column_names[table_name][0]}, {self.table_column_names[table_name][1]}"
+            if self.schema_profile == SchemaProfile.PRIMARY_KEY:
+                column_definitions.append(f"PRIMARY KEY ({key_columns})")
             column_definitions_str = ", ".join(column_definitions)
             cursor.execute(f"CREATE TABLE {table_name} ({column_definitions_str})")
+            if self.schema_profile == SchemaProfile.SECONDARY_INDEX:
+                cursor.execute(f"CREATE INDEX {table_name}_keys ON {table_name} ({key_columns})")
+            elif self.schema_profile == SchemaProfile.BRIN:
+                cursor.execute(f"CREATE INDEX {table_name}_keys ON {table_name} USING brin ({key_columns})")
         self.connection.commit()
 
     def __normalize_table_column_names(self):
@@ -33,49 +64,96 @@ class PostgresDatabaseTesting(DatabaseTestingInterface):
             column_names = [''.join(c for c in name.strip() if c.isalnum() or c == '_') for name in column_names]
             self.table_column_names[table_name] = column_names
 
-    def __parse_csv_data(self, file_path: str) -> Tuple[List[str], List[Tuple[str, str, float, int]]]:
-        MAX_DATA_READ = 1000
-        with open(file_path, "r") as f:
-            reader = csv.reader(f, delimiter="|")
-            column_names = next(reader)
-            rows = itertools.islice(reader, MAX_DATA_READ)
-            data = []
-            for row in rows:
-                row[0] = row[0].replace(",", ".")
-                row[1] = row[1].replace(",", ".")
-                data.append(tuple(row))
-
-        return column_names, data
-
-    def create(self, rows_created: int = 1, transactions: int = 1):
-        for table_name, data in self.csv_data.items():
+    def __prepare(self, name: str, parameter_types: str, query: str, parameter_count: int) -> str:
+        cursor = self.connection.cursor()
+        cursor.execute(f"PREPARE {name} ({parameter_types}) AS {query}")
+        return f"EXECUTE {name} ({', '.join(['%s'] * parameter_count)})"
+
+    def prepareStatement(self, table_name: str, operation: str) -> str:
+        column_names = self.table_column_names[table_name]
+        name = f"{table_name}_{operation}"
+        if operation == "insert":
+            return self.__prepare(name, "timestamp, timestamp, numeric, integer", f"INSERT INTO {table_name} VALUES ($1, $2, $3, $4)", 4)
+        if operation == "read_limit":
+            return self.__prepare(name, "bigint", f"SELECT * FROM {table_name} LIMIT $1", 1)
+        if operation == "read_point":
+            return self.__prepare(name, "timestamp, timestamp", f"SELECT * FROM {table_name} WHERE {column_names[0]} = $1 AND {column_names[1]} = $2", 2)
+        if operation == "read_range":
+            return self.__prepare(name, "timestamp, timestamp", f"SELECT * FROM {table_name} WHERE {column_names[0]} >= $1 AND {column_names[0]} <= $2", 2)
+        if operation == "read_stream":
+            return f"SELECT * FROM {table_name}"
+        if operation == "update":
+            return self.__prepare(name, "timestamp, timestamp", f"UPDATE {table_name} SET {column_names[2]} = 0 WHERE {column_names[0]} = $1 AND {column_names[1]} = $2", 2)
+        if operation == "delete":
+            return self.__prepare(name, "timestamp, timestamp", f"DELETE FROM {table_name} WHERE {column_names[0]} = $1 AND {column_names[1]} = $2", 2)
+        if operation == "insert_values":
+            return f"INSERT INTO {table_name} VALUES %s"
+        if operation == "copy":
+            return f"COPY {table_name} FROM STDIN"
+        return super().prepareStatement(table_name, operation)
+
+    def create(self, rows_created: int = 1, transactions: int = 1, insert_mode: InsertMode = InsertMode.ROW, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
             for transaction in range(transactions):
                 cursor = self.connection.cursor()
-                for i in range(rows_created):
-                    cursor.execute(f"INSERT INTO {table_name} VALUES (%s, %s, %s, %s)", data[i+transaction*rows_created])
+                rows = dataset.rows(offset + transaction*rows_created, offset + (transaction+1)*rows_created)
+                if insert_mode == InsertMode.COPY:
+                    buffer = io.StringIO("".join(f"{row[0]}\t{row[1]}\t{row[2]!r}\t{row[3]}\n" for row in rows.text_rows()))
+                    cursor.copy_expert(self.getStatement(table_name, "copy"), buffer)
+                elif insert_mode == InsertMode.BULK:
+                    psycopg2.extras.execute_values(cursor, self.getStatement(table_name, "insert_values"), rows, page_size=max(len(rows), 1))
+                else:
+                    statement = self.getStatement(table_name, "insert")
+                    for row in rows:
+                        cursor.execute(statement, row)
                 self.connection.commit()
 
-    def read(self, rows_read: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def read(self, rows_read: int = 1, transactions: int = 1, offset: int = 0, read_mode: ReadMode = ReadMode.LIMIT) -> int:
+        rows_fetched = 0
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, f"read_{read_mode.value}")
             for transaction in range(transactions):
+                rows = dataset.rows(offset + transaction*rows_read, offset + (transaction+1)*rows_read)
+                if read_mode == ReadMode.STREAM:
+                    cursor = self.connection.cursor(name=f"{table_name}_stream")
+                    cursor.execute(statement)
+                    batch = cursor.fetchmany(rows_read)
+                    while batch:
+                        rows_fetched += self.countRows(batch)
+                        batch = cursor.fetchmany(rows_read)
+                    cursor.close()
+                    self.connection.commit()
+                    continue
                 cursor = self.connection.cursor()
-                cursor.execute(f"SELECT * FROM {table_name} LIMIT {rows_read}")
-                cursor.fetchone()
+                if read_mode == ReadMode.POINT:
+                    for row in rows:
+                        cursor.execute(statement, (row[0], row[1]))
+                        rows_fetched += self.countRows(cursor.fetchall())
+                elif read_mode == ReadMode.RANGE:
+                    if len(rows):
+                        cursor.execute(statement, rows.timestamp_range(0))
+                        rows_fetched += self.countRows(cursor.fetchall())
+                else:
+                    cursor.execute(statement, (rows_read,))
+                    rows_fetched += self.countRows(cursor.fetchmany(1))
+        return rows_fetched
 
-    def update(self, rows_updated: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def update(self, rows_updated: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "update")
             for transaction in range(transactions):
                 cursor = self.connection.cursor()
-                for i in range(rows_updated):
-                    cursor.execute(f"UPDATE {table_name} SET {self.table_column_names[table_name][2]} = 0 WHERE {self.table_column_names[table_name][0]} = %s", (self.csv_data[table_name][i+transaction*rows_updated][0],))
+                for row in dataset.rows(offset + transaction*rows_updated, offset + (transaction+1)*rows_updated):
+                    cursor.execute(statement, (row[0], row[1]))
                 self.connection.commit()
 
-    def delete(self, rows_deleted: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def delete(self, rows_deleted: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "delete")
             for transaction in range(transactions):
                 cursor = self.connection.cursor()
-                for i in range(rows_deleted):
-                    cursor.execute(f"DELETE FROM {table_name} WHERE {self.table_column_names[table_name][0]} = %s", (self.csv_data[table_name][i+transaction*rows_deleted][0],))
+                for row in dataset.rows(offset + transaction*rows_deleted, offset + (transaction+1)*rows_deleted):
+                    cursor.execute(statement, (row[0], row[1]))
                 self.connection.commit()
 
     def reset(self):
@@ -85,8 +163,75 @@ class PostgresDatabaseTesting(DatabaseTestingInterface):
         self.connection.commit()
         self.__create_tables()
 
+    def truncate(self):
+        cursor = self.connection.cursor()
+        cursor.execute(f"TRUNCATE {', '.join(self.table_names)}")
+        self.connection.commit()
+
     def getName(self) -> str:
-        return "PostgreSQL"
+        return " ".join(["PostgreSQL"] + self.getConfiguration())
+
+    def getSchemaProfiles(self) -> List[SchemaProfile]:
+        return [SchemaProfile.NONE, SchemaProfile.PRIMARY_KEY, SchemaProfile.SECONDARY_INDEX, SchemaProfile.BRIN]
+
+    def getConfiguration(self) -> List[str]:
+        configuration = [] if self.schema_profile == SchemaProfile.NONE else [f"schema={self.schema_profile.value}"]
+        if self.commit_delay is not None:
+            configuration.append(f"commit_delay={self.commit_delay}")
+        return configuration + super().getConfiguration()
+
+    def getDurabilityProfiles(self) -> List[DurabilityProfile]:
+        if self.synchronous_standby:
+            return [DurabilityProfile.STRICT, DurabilityProfile.DEFAULT, DurabilityProfile.RELAXED, DurabilityProfile.NONE]
+        return [DurabilityProfile.DEFAULT, DurabilityProfile.RELAXED]
+
+    def setDurabilityProfile(self, durability_profile: DurabilityProfile):
+        previous_profile = self.getDurabilityProfile()
+        super().setDurabilityProfile(durability_profile)
+        synchronous_commit = self.DURABILITY_SETTINGS[durability_profile] if self.synchronous_standby or durability_profile != DurabilityProfile.RELAXED else "off"
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("RESET ALL")
+            if synchronous_commit is not None:
+                cursor.execute(f"SET synchronous_commit TO {synchronous_commit}")
+            if self.commit_delay is not None:
+                cursor.execute(f"SET commit_delay TO {int(self.commit_delay)}")
+                cursor.execute("SET commit_siblings TO 1")
+            self.connection.commit()
+        except psycopg2.Error:
+            self.connection.rollback()
+            self.durability_profile = previous_profile
+            raise
+
+    def getInsertModes(self) -> List[InsertMode]:
+        return [InsertMode.ROW, InsertMode.BULK, InsertMode.COPY]
+
+    def getServerProcessNames(self) -> List[str]:
+        return ["postgres"]
+
+    def getSoftwareVersions(self) -> List[str]:
+        return [f"psycopg2 {psycopg2.__version__}", f"server {self.connection.server_version}"]
+
+    @staticmethod
+    def __check_connection(connection):
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        connection.rollback()
+
+    @staticmethod
+    def __reset_connection(connection):
+        connection.rollback()
+        connection.cursor().execute("DEALLOCATE ALL")
+        connection.commit()
+
+    @staticmethod
+    def createPool(connection_string: str, size: int = 4, warmup: bool = True) -> ConnectionPool:
+        return ConnectionPool(lambda: psycopg2.connect(connection_string), size, healthCheck=PostgresDatabaseTesting.__check_connection,
+                              reset=PostgresDatabaseTesting.__reset_connection, warmup=warmup)
 
     def __del__(self):
-        self.connection.close()
\ No newline at end of file
+        if self.pool is not None:
+            self.pool.release(self.connection)
+        else:
+            self.connection.close()
\ No newline at end of file
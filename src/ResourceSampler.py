@@ -0,0 +1,137 @@
+import os
+import resource
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+class ResourceSampler:
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    IO_FIELDS = ("read_bytes", "write_bytes", "syscw")
+
+    def __init__(self, processNames: List[str] = [], interval: float = 0.1, traceAllocations: bool = False):
+        self.processNames = processNames
+        self.interval = interval
+        self.traceAllocations = traceAllocations
+        self.thread = None
+        self.stopEvent = threading.Event()
+
+    @staticmethod
+    def __read(path: str) -> str:
+        try:
+            with open(path, "rb") as file:
+                return file.read().decode(errors="replace")
+        except OSError:
+            return ""
+
+    def __serverPids(self) -> List[int]:
+        if not self.processNames or not os.path.isdir("/proc"):
+            return []
+        pids = []
+        for entry in os.listdir("/proc"):
+            if entry.isdigit() and int(entry) != os.getpid():
+                commandLine = self.__read(f"/proc/{entry}/cmdline").replace("\0", " ")
+                if any(name in commandLine for name in self.processNames):
+                    pids.append(int(entry))
+        return pids
+
+    def __processCounters(self, pid) -> Tuple[float, Dict[str, int]]:
+        stat = self.__read(f"/proc/{pid}/stat")
+        fields = stat[stat.rfind(")") + 2:].split()
+        cpu = (int(fields[11]) + int(fields[12])) / self.CLOCK_TICKS if len(fields) > 12 else 0.0
+        io = {}
+        for line in self.__read(f"/proc/{pid}/io").splitlines():
+            name, _, value = line.partition(":")
+            if name in self.IO_FIELDS:
+                io[name] = int(value)
+        return cpu, io
+
+    def __rss(self, pid) -> int:
+        statm = self.__read(f"/proc/{pid}/statm").split()
+        return int(statm[1]) * self.PAGE_SIZE if len(statm) > 1 else 0
+
+    def __snapshot(self) -> Dict[int, Tuple[float, Dict[str, int]]]:
+        return {pid: self.__processCounters(pid) for pid in self.__serverPids()}
+
+    def __sample(self):
+        while not self.stopEvent.wait(self.interval):
+            if not self.paused:
+                self.clientMaxRss = max(self.clientMaxRss, self.__rss("self"))
+                self.serverMaxRss = max(self.serverMaxRss, sum(self.__rss(pid) for pid in self.serverStart))
+
+    def __counters(self) -> Tuple:
+        return time.perf_counter(), resource.getrusage(resource.RUSAGE_SELF), self.__processCounters("self")[1], self.__snapshot()
+
+    @staticmethod
+    def __difference(start: Tuple, end: Tuple) -> Dict[str, float]:
+        startTime, startUsage, startIo, serverStart = start
+        endTime, usage, clientIo, serverEnd = end
+        metrics = {
+            'elapsed': endTime - startTime,
+            'clientCpu': usage.ru_utime - startUsage.ru_utime + usage.ru_stime - startUsage.ru_stime,
+            'clientReadBytes': clientIo.get("read_bytes", 0) - startIo.get("read_bytes", 0),
+            'clientWriteBytes': clientIo.get("write_bytes", 0) - startIo.get("write_bytes", 0),
+            'clientWriteCalls': clientIo.get("syscw", 0) - startIo.get("syscw", 0),
+            'serverCpu': 0.0,
+            'serverReadBytes': 0,
+            'serverWriteBytes': 0,
+            'serverWriteCalls': 0
+        }
+        for pid, (cpu, io) in serverEnd.items():
+            startCpu, startIo = serverStart.get(pid, (0.0, {}))
+            metrics['serverCpu'] += cpu - startCpu
+            metrics['serverReadBytes'] += io.get("read_bytes", 0) - startIo.get("read_bytes", 0)
+            metrics['serverWriteBytes'] += io.get("write_bytes", 0) - startIo.get("write_bytes", 0)
+            metrics['serverWriteCalls'] += io.get("syscw", 0) - startIo.get("syscw", 0)
+        return metrics
+
+    def start(self):
+        self.stopEvent.clear()
+        self.paused = False
+        if self.traceAllocations:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+        self.allocatedPeak = 0
+        self.startCounters = self.__counters()
+        self.serverStart = self.startCounters[3]
+        self.excluded = {}
+        self.clientMaxRss = self.__rss("self")
+        self.serverMaxRss = sum(self.__rss(pid) for pid in self.serverStart)
+        self.thread = threading.Thread(target=self.__sample, daemon=True)
+        self.thread.start()
+
+    def pause(self):
+        self.paused = True
+        if self.traceAllocations:
+            self.allocatedPeak = max(self.allocatedPeak, tracemalloc.get_traced_memory()[1])
+        self.pauseCounters = self.__counters()
+
+    def resume(self):
+        for name, value in self.__difference(self.pauseCounters, self.__counters()).items():
+            self.excluded[name] = self.excluded.get(name, 0) + value
+        if self.traceAllocations:
+            tracemalloc.reset_peak()
+        self.paused = False
+
+    def stop(self) -> Dict[str, float]:
+        self.stopEvent.set()
+        self.thread.join()
+        endCounters = self.__counters()
+        metrics = self.__difference(self.startCounters, endCounters)
+        for name, value in self.excluded.items():
+            metrics[name] -= value
+        metrics['clientMaxRss'] = self.clientMaxRss
+        metrics['serverProcesses'] = len(endCounters[3])
+        metrics['serverMaxRss'] = self.serverMaxRss
+        if self.traceAllocations:
+            metrics['clientAllocatedPeak'] = max(self.allocatedPeak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        return metrics
+
+    def __enter__(self) -> "ResourceSampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.metrics = self.stop()
\ No newline at end of file
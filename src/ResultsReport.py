@@ -0,0 +1,150 @@
+import io
+import math
+from html import escape
+from typing import Dict, List, Optional, Tuple
+from matplotlib.figure import Figure
+
+def _regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _regularized_incomplete_beta(b, a, 1.0 - x)
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1.0 - x)) / a
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > 1e-300 else 1e-300)
+    fraction = d
+    for m in range(1, 200):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)), -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > 1e-300 else 1e-300)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > 1e-300 else 1e-300
+            fraction *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return front * fraction
+
+def welch_t_test(meanA: float, stddevA: float, samplesA: int, meanB: float, stddevB: float, samplesB: int) -> Optional[Tuple[float, float, float]]:
+    if samplesA < 2 or samplesB < 2:
+        return None
+    varianceA, varianceB = stddevA ** 2 / samplesA, stddevB ** 2 / samplesB
+    standardError = math.sqrt(varianceA + varianceB)
+    if standardError == 0.0:
+        return None
+    t = (meanB - meanA) / standardError
+    degreesOfFreedom = (varianceA + varianceB) ** 2 / (varianceA ** 2 / (samplesA - 1) + varianceB ** 2 / (samplesB - 1))
+    p = _regularized_incomplete_beta(degreesOfFreedom / 2, 0.5, degreesOfFreedom / (degreesOfFreedom + t * t))
+    return t, degreesOfFreedom, p
+
+class ResultsReport:
+    DIMENSIONS = {
+        'batchSize': 'Number of records per transaction',
+        'datasetSize': 'Dataset size (records)',
+        'clients': 'Number of concurrent clients'
+    }
+    METRICS = {
+        'throughput': 'Throughput (records per second)',
+        'mean': 'Mean transaction latency (seconds)'
+    }
+
+    def __init__(self, resultsStore: ResultsStore, alpha: float = 0.05, minimumChange: float = 0.05):
+        self.resultsStore = resultsStore
+        self.alpha = alpha
+        self.minimumChange = minimumChange
+
+    def __series(self, runId: str, dimension: str, metric: str) -> Dict[str, Dict[str, Dict[float, float]]]:
+        series = {}
+        for record in self.resultsStore.records(runId):
+            if record[dimension] is None or (dimension == 'clients') != record['operation'].startswith('concurrent_'):
+                continue
+            series.setdefault(record['operation'], {}).setdefault(record['backend'], {})[record[dimension]] = record[metric]
+        return series
+
+    def figures(self, runId: str = None, dimension: str = 'batchSize', metric: str = 'throughput') -> List[Figure]:
+        figures = []
+        for operation, backends in sorted(self.__series(runId, dimension, metric).items()):
+            if max(len(points) for points in backends.values()) < 2:
+                continue
+            figure = Figure(figsize=(8, 5))
+            axes = figure.add_subplot()
+            for backend, points in sorted(backends.items()):
+                x = sorted(points)
+                axes.plot(x, [points[value] for value in x], marker='o', label=backend)
+            axes.set_xscale('log')
+            axes.set_yscale('log')
+            axes.set_title(f'{operation}: {self.METRICS[metric].split(" (")[0].lower()} against {self.DIMENSIONS[dimension].split(" (")[0].lower()}.')
+            axes.set_xlabel(self.DIMENSIONS[dimension])
+            axes.set_ylabel(self.METRICS[metric])
+            axes.legend()
+            figures.append(figure)
+        return figures
+
+    @staticmethod
+    def __keyed(records: List[Dict[str, object]]) -> Dict[Tuple[str, str, int, int], Dict[str, object]]:
+        return {(record['backend'], record['operation'], record['batchSize'], record['clients']): record for record in records}
+
+    def reused(self, runId: str) -> List[Tuple[str, str, int, int]]:
+        return sorted(key for key, record in self.__keyed(self.resultsStore.records(runId)).items() if record['reusedFrom'] is not None)
+
+    def compare(self, baselineRunId: str, candidateRunId: str) -> List[Dict[str, object]]:
+        baseline, candidate = self.__keyed(self.resultsStore.records(baselineRunId)), self.__keyed(self.resultsStore.records(candidateRunId))
+        comparisons = []
+        for key in sorted(baseline.keys() & candidate.keys()):
+            if candidate[key]['reusedFrom'] is not None:
+                continue
+            before, after = baseline[key], candidate[key]
+            test = welch_t_test(before['mean'], before['stddev'], before['samples'], after['mean'], after['stddev'], after['samples'])
+            change = (after['mean'] - before['mean']) / before['mean'] if before['mean'] else 0.0
+            p = test[2] if test is not None else None
+            comparisons.append({
+                'backend': key[0],
+                'operation': key[1],
+                'batchSize': key[2],
+                'clients': key[3],
+                'baselineMean': before['mean'],
+                'candidateMean': after['mean'],
+                'change': change,
+                't': test[0] if test is not None else None,
+                'p': p,
+                'regression': p is not None and p < self.alpha and change > self.minimumChange,
+                'improvement': p is not None and p < self.alpha and change < -self.minimumChange
+            })
+        return comparisons
+
+    def regressions(self, baselineRunId: str, candidateRunId: str) -> List[Dict[str, object]]:
+        return [comparison for comparison in self.compare(baselineRunId, candidateRunId) if comparison['regression']]
+
+    @staticmethod
+    def __svg(figure: Figure) -> str:
+        buffer = io.StringIO()
+        figure.savefig(buffer, format='svg', bbox_inches='tight')
+        text = buffer.getvalue()
+        return text[text.index('<svg'):]
+
+    def writeHtml(self, path: str, runId: str = None, baselineRunId: str = None, dimensions: List[str] = ['batchSize', 'datasetSize', 'clients']) -> str:
+        title = f'Benchmark report for run {runId}' if runId is not None else 'Benchmark report for all runs'
+        parts = [f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{escape(title)}</title>',
+                 '<style>body{font-family:sans-serif} table{border-collapse:collapse} td,th{border:1px solid #ccc;padding:2px 6px;text-align:right} .regression{background:#fbb} .improvement{background:#bfb}</style>',
+                 f'</head><body><h1>{escape(title)}</h1>']
+        if baselineRunId is not None and runId is not None:
+            parts.append(f'<h2>Comparison against run {escape(baselineRunId)}</h2><table><tr><th>Backend</th><th>Operation</th><th>Batch</th><th>Clients</th><th>Baseline mean (s)</th><th>Candidate mean (s)</th><th>Change</th><th>p</th></tr>')
+            for comparison in self.compare(baselineRunId, runId):
+                rowClass = 'regression' if comparison['regression'] else 'improvement' if comparison['improvement'] else ''
+                p = f"{comparison['p']:.3g}" if comparison['p'] is not None else 'n/a'
+                parts.append(f'<tr class="{rowClass}"><td>{escape(comparison["backend"])}</td><td>{escape(comparison["operation"])}</td><td>{comparison["batchSize"]}</td><td>{comparison["clients"]}</td>'
+                             f'<td>{comparison["baselineMean"]:.6g}</td><td>{comparison["candidateMean"]:.6g}</td><td>{comparison["change"]:+.1%}</td><td>{p}</td></tr>')
+            parts.append('</table>')
+            reused = self.reused(runId)
+            if reused:
+                parts.append(f'<p>{len(reused)} results were reused from earlier runs instead of re-measured and are not compared: '
+                             + ', '.join(escape(f'{backend} {operation} (batch {batchSize}, clients {clients})') for backend, operation, batchSize, clients in reused) + '.</p>')
+        for dimension in dimensions:
+            for metric in self.METRICS:
+                for figure in self.figures(runId if dimension != 'datasetSize' else None, dimension, metric):
+                    parts.append(self.__svg(figure))
+        parts.append('</body></html>')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("\n".join(parts))
+        return path
\ No newline at end of file
@@ -0,0 +1,81 @@
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+class ResultsStore:
+    RESULT_FIELDS = ('samples', 'mean', 'stddev', 'halfWidth', 'throughput', 'bytesPerSecond')
+
+    def __init__(self, path: str = "results.db"):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("""CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            backend TEXT NOT NULL,
+            operation TEXT NOT NULL,
+            batch_size INTEGER NOT NULL,
+            dataset_hash TEXT NOT NULL,
+            code_version TEXT NOT NULL,
+            samples INTEGER NOT NULL,
+            mean REAL NOT NULL,
+            stddev REAL NOT NULL,
+            half_width REAL NOT NULL,
+            throughput REAL NOT NULL,
+            histogram BLOB,
+            dataset_size INTEGER,
+            clients INTEGER NOT NULL DEFAULT 1,
+            bytes_per_second REAL,
+            reused_from INTEGER)""")
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(results)")}
+        if "dataset_size" not in columns:
+            self.connection.execute("ALTER TABLE results ADD COLUMN dataset_size INTEGER")
+        if "clients" not in columns:
+            self.connection.execute("ALTER TABLE results ADD COLUMN clients INTEGER NOT NULL DEFAULT 1")
+        if "bytes_per_second" not in columns:
+            self.connection.execute("ALTER TABLE results ADD COLUMN bytes_per_second REAL")
+        if "reused_from" not in columns:
+            self.connection.execute("ALTER TABLE results ADD COLUMN reused_from INTEGER")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_key ON results (backend, operation, batch_size, dataset_hash, code_version, created_at)")
+        self.connection.commit()
+
+    def save(self, runId: str, backend: str, operation: str, batchSize: int, datasetHash: str, codeVersion: str, result: Dict[str, float], histogram: LatencyHistogram = None, datasetSize: int = None, clients: int = 1):
+        self.connection.execute(
+            "INSERT INTO results (run_id, created_at, backend, operation, batch_size, dataset_hash, code_version, samples, mean, stddev, half_width, throughput, bytes_per_second, histogram, dataset_size, clients) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (runId, time.time(), backend, operation, batchSize, datasetHash, codeVersion, *(result.get(field) for field in self.RESULT_FIELDS), histogram.to_bytes() if histogram is not None else None, datasetSize, clients))
+        self.connection.commit()
+
+    def load(self, backend: str, operation: str, batchSize: int, datasetHash: str, codeVersion: str, maxAge: float = None, clients: int = 1, runId: str = None, datasetSize: int = None) -> Optional[Tuple[Dict[str, float], Optional[LatencyHistogram]]]:
+        query = "SELECT samples, mean, stddev, half_width, throughput, bytes_per_second, histogram, id, run_id FROM results WHERE backend = ? AND operation = ? AND batch_size = ? AND dataset_hash = ? AND code_version = ? AND clients = ? AND dataset_size IS ? AND reused_from IS NULL"
+        parameters = [backend, operation, batchSize, datasetHash, codeVersion, clients, datasetSize]
+        if maxAge is not None:
+            query += " AND created_at >= ?"
+            parameters.append(time.time() - maxAge)
+        row = self.connection.execute(query + " ORDER BY created_at DESC LIMIT 1", parameters).fetchone()
+        if row is None:
+            return None
+        if runId is not None and row[8] != runId:
+            columns = "backend, operation, batch_size, dataset_hash, code_version, samples, mean, stddev, half_width, throughput, bytes_per_second, histogram, dataset_size, clients"
+            self.connection.execute(f"INSERT INTO results (run_id, created_at, reused_from, {columns}) SELECT ?, ?, id, {columns} FROM results WHERE id = ? "
+                                    "AND NOT EXISTS (SELECT 1 FROM results WHERE run_id = ? AND reused_from = ?)", (runId, time.time(), row[7], runId, row[7]))
+            self.connection.commit()
+        result = dict(zip(self.RESULT_FIELDS, row[:6]))
+        return result, LatencyHistogram.from_bytes(row[6]) if row[6] is not None else None
+
+    def runs(self) -> List[Tuple[str, float]]:
+        return self.connection.execute("SELECT run_id, MIN(created_at) FROM results GROUP BY run_id ORDER BY MIN(created_at)").fetchall()
+
+    def results(self, runId: str) -> Dict[Tuple[str, str, int], Dict[str, float]]:
+        rows = self.connection.execute("SELECT backend, operation, batch_size, samples, mean, stddev, half_width, throughput, bytes_per_second FROM results WHERE run_id = ? AND clients = 1 ORDER BY id", (runId,))
+        return {(row[0], row[1], row[2]): dict(zip(self.RESULT_FIELDS, row[3:])) for row in rows}
+
+    def records(self, runId: str = None) -> List[Dict[str, object]]:
+        query = "SELECT run_id, created_at, backend, operation, batch_size, dataset_size, clients, samples, mean, stddev, half_width, throughput, bytes_per_second, reused_from FROM results"
+        parameters = []
+        if runId is not None:
+            query += " WHERE run_id = ?"
+            parameters.append(runId)
+        names = ('runId', 'createdAt', 'backend', 'operation', 'batchSize', 'datasetSize', 'clients') + self.RESULT_FIELDS + ('reusedFrom',)
+        return [dict(zip(names, row)) for row in self.connection.execute(query + " ORDER BY id", parameters)]
+
+    def __del__(self):
+        self.connection.close()
\ No newline at end of file
@@ -1,22 +1,40 @@
 import sqlite3
 
+sqlite3.register_adapter(datetime, lambda timestamp: timestamp.isoformat(" "))
+
 class SqliteDatabaseTesting(DatabaseTestingInterface):
-    def __init__(self, connection_string: str, csv_file_paths: List[str]):
-        self.connection = sqlite3.connect(connection_string)
-        self.csv_data = {}
+    DURABILITY_SETTINGS = {
+        DurabilityProfile.STRICT: (None, "EXTRA"),
+        DurabilityProfile.DEFAULT: (None, "FULL"),
+        DurabilityProfile.RELAXED: ("WAL", "NORMAL"),
+        DurabilityProfile.NONE: ("MEMORY", "OFF")
+    }
+
+    def __init__(self, connection_string: str, csv_file_paths: List[str], create_schema: bool = True, journal_mode: str = None, timeout: float = 60.0, schema_profile: SchemaProfile = SchemaProfile.NONE, durability_profile: DurabilityProfile = DurabilityProfile.DEFAULT, pool: ConnectionPool = None):
+        if schema_profile not in self.getSchemaProfiles():
+            raise ValueError(f"Schema profile {schema_profile.value} is not supported by SQLite")
+        self.schema_profile = schema_profile
+        self.pool = pool
+        self.connection = pool.acquire() if pool is not None else sqlite3.connect(connection_string, timeout=timeout, cached_statements=256)
+        self.journal_mode = journal_mode or self.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.setDurabilityProfile(durability_profile)
+        self.datasets = {}
         self.table_names = []
         self.table_column_names = {}
 
         for file_path in csv_file_paths:
-            table_name = os.path.splitext(os.path.basename(file_path))[0]
-            self.table_names.append(table_name)
-            self.table_column_names[table_name], self.csv_data[table_name] = self.__parse_csv_data(file_path)
+            dataset = load_dataset(file_path)
+            self.table_names.append(dataset.name)
+            self.datasets[dataset.name] = dataset
+            self.table_column_names[dataset.name] = list(dataset.column_names)
 
         self.__normalize_table_column_names()
-        self.__create_tables()
+        if create_schema:
+            self.__create_tables()
         self.connection.commit()
 
     def __create_tables(self):
+        self.clearStatements()
         c = self.connection.cursor()
         for table_name in self.table_names:
             c.execute(f"DROP TABLE IF EXISTS {table_name}")
@@ -25,8 +43,14 @@ class SqliteDatabaseTesting(DatabaseTestingInterface):
             column_definitions.append(f"{self.table_column_names[table_name][1]} timestamp NOT NULL")
             column_definitions.append(f"{self.table_column_names[table_name][2]} numerical NOT NULL")
             column_definitions.append(f"{self.table_column_names[table_name][3]} int")
+            key_columns = f"{self.table_column_names[table_name][0]}, {self.table_column_names[table_name][1]}"
+            if self.schema_profile in (SchemaProfile.PRIMARY_KEY, SchemaProfile.CLUSTERED):
+                column_definitions.append(f"PRIMARY KEY ({key_columns})")
             column_definitions_str = ", ".join(column_definitions)
-            c.execute(f"CREATE TABLE {table_name} ({column_definitions_str})")
+            table_options = " WITHOUT ROWID" if self.schema_profile == SchemaProfile.CLUSTERED else ""
+            c.execute(f"CREATE TABLE {table_name} ({column_definitions_str}){table_options}")
+            if self.schema_profile == SchemaProfile.SECONDARY_INDEX:
+                c.execute(f"CREATE INDEX {table_name}_keys ON {table_name} ({key_columns})")
         self.connection.commit()
 
     def __normalize_table_column_names(self):
@@ -34,44 +58,79 @@ class SqliteDatabaseTesting(DatabaseTestingInterface):
             column_names = [''.join(c for c in name.strip() if c.isalnum() or c == '_') for name in column_names]
             self.table_column_names[table_name] = column_names
 
-    def __parse_csv_data(self, file_path: str) -> Tuple[List[str], List[Tuple[str, str, float, int]]]:
-        MAX_DATA_READ = 1000
-        with open(file_path, "r") as f:
-            reader = csv.reader(f, delimiter="|")
-            column_names = next(reader)
-            rows = itertools.islice(reader, MAX_DATA_READ)
-            data = [tuple(row) for row in rows]
-        return column_names, data
-
-    def create(self, rows_created: int = 1, transactions: int = 1):
-        for table_name, data in self.csv_data.items():
+    def prepareStatement(self, table_name: str, operation: str) -> str:
+        column_names = self.table_column_names[table_name]
+        if operation == "insert":
+            return f"INSERT INTO {table_name} VALUES (?, ?, ?, ?)"
+        if operation == "read_limit":
+            return f"SELECT * FROM {table_name} LIMIT ?"
+        if operation == "read_point":
+            return f"SELECT * FROM {table_name} WHERE {column_names[0]} = ? AND {column_names[1]} = ?"
+        if operation == "read_range":
+            return f"SELECT * FROM {table_name} WHERE {column_names[0]} >= ? AND {column_names[0]} <= ?"
+        if operation == "read_stream":
+            return f"SELECT * FROM {table_name}"
+        if operation == "update":
+            return f"UPDATE {table_name} SET {column_names[2]} = 0 WHERE {column_names[0]} = ? AND {column_names[1]} = ?"
+        if operation == "delete":
+            return f"DELETE FROM {table_name} WHERE {column_names[0]} = ? AND {column_names[1]} = ?"
+        return super().prepareStatement(table_name, operation)
+
+    def create(self, rows_created: int = 1, transactions: int = 1, insert_mode: InsertMode = InsertMode.ROW, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "insert")
             for transaction in range(transactions):
                 c = self.connection.cursor()
-                for i in range(rows_created):
-                    c.execute(f"INSERT INTO {table_name} VALUES (?, ?, ?, ?)", data[i+transaction*rows_created])
+                rows = dataset.rows(offset + transaction*rows_created, offset + (transaction+1)*rows_created).text_rows()
+                if insert_mode == InsertMode.ROW:
+                    for row in rows:
+                        c.execute(statement, row)
+                else:
+                    c.executemany(statement, rows)
                 self.connection.commit()
 
-    def read(self, rows_read: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def read(self, rows_read: int = 1, transactions: int = 1, offset: int = 0, read_mode: ReadMode = ReadMode.LIMIT) -> int:
+        rows_fetched = 0
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, f"read_{read_mode.value}")
             for transaction in range(transactions):
                 c = self.connection.cursor()
-                c.execute(f"SELECT * FROM {table_name} LIMIT {rows_read}")
-                c.fetchone()
+                rows = dataset.rows(offset + transaction*rows_read, offset + (transaction+1)*rows_read)
+                if read_mode == ReadMode.POINT:
+                    for row in rows.text_rows():
+                        c.execute(statement, (row[0], row[1]))
+                        rows_fetched += self.countRows(c.fetchall())
+                elif read_mode == ReadMode.RANGE:
+                    if len(rows):
+                        c.execute(statement, rows.timestamp_range(0))
+                        rows_fetched += self.countRows(c.fetchall())
+                elif read_mode == ReadMode.STREAM:
+                    c.execute(statement)
+                    batch = c.fetchmany(rows_read)
+                    while batch:
+                        rows_fetched += self.countRows(batch)
+                        batch = c.fetchmany(rows_read)
+                else:
+                    c.execute(statement, (rows_read,))
+                    rows_fetched += self.countRows(c.fetchmany(1))
+        return rows_fetched
 
-    def update(self, rows_updated: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def update(self, rows_updated: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "update")
             for transaction in range(transactions):
                 c = self.connection.cursor()
-                for i in range(rows_updated):
-                    c.execute(f"UPDATE {table_name} SET {self.table_column_names[table_name][2]} = 0 WHERE {self.table_column_names[table_name][0]} = \"{self.csv_data[table_name][i+transaction*rows_updated][0]}\"")
+                for row in dataset.rows(offset + transaction*rows_updated, offset + (transaction+1)*rows_updated).text_rows():
+                    c.execute(statement, (row[0], row[1]))
                 self.connection.commit()
 
-    def delete(self, rows_deleted: int = 1, transactions: int = 1):
-        for table_name in self.table_names:
+    def delete(self, rows_deleted: int = 1, transactions: int = 1, offset: int = 0):
+        for table_name, dataset in self.datasets.items():
+            statement = self.getStatement(table_name, "delete")
             for transaction in range(transactions):
                 c = self.connection.cursor()
-                for i in range(rows_deleted):
-                    c.execute(f"DELETE FROM {table_name} WHERE {self.table_column_names[table_name][0]} = \"{self.csv_data[table_name][i+transaction*rows_deleted][0]}\"")
+                for row in dataset.rows(offset + transaction*rows_deleted, offset + (transaction+1)*rows_deleted).text_rows():
+                    c.execute(statement, (row[0], row[1]))
                 self.connection.commit()
 
     def reset(self):
@@ -83,8 +142,53 @@ class SqliteDatabaseTesting(DatabaseTestingInterface):
         self.connection.commit()
         self.__create_tables()
 
+    def truncate(self):
+        c = self.connection.cursor()
+        for table_name in self.table_names:
+            c.execute(f"DELETE FROM {table_name}")
+        self.connection.commit()
+
+    @staticmethod
+    def createPool(connection_string: str, size: int = 4, timeout: float = 60.0, warmup: bool = True) -> ConnectionPool:
+        baselines = {}
+
+        def connect():
+            connection = sqlite3.connect(connection_string, timeout=timeout, cached_statements=256)
+            baselines[id(connection)] = (connection.execute("PRAGMA journal_mode").fetchone()[0], connection.execute("PRAGMA synchronous").fetchone()[0])
+            return connection
+
+        def reset(connection):
+            connection.rollback()
+            journal_mode, synchronous = baselines[id(connection)]
+            connection.execute(f"PRAGMA journal_mode={journal_mode}")
+            connection.execute(f"PRAGMA synchronous={synchronous}")
+
+        return ThreadLocalConnectionPool(connect, size, healthCheck=lambda connection: connection.execute("SELECT 1").fetchone(), reset=reset, warmup=warmup)
+
     def __del__(self):
-        self.connection.close()
+        if self.pool is not None:
+            self.pool.release(self.connection)
+        else:
+            self.connection.close()
 
     def getName(self) -> str:
-        return "SQLite"
\ No newline at end of file
+        return " ".join(["SQLite"] + self.getConfiguration())
+
+    def getSchemaProfiles(self) -> List[SchemaProfile]:
+        return [SchemaProfile.NONE, SchemaProfile.PRIMARY_KEY, SchemaProfile.SECONDARY_INDEX, SchemaProfile.CLUSTERED]
+
+    def getConfiguration(self) -> List[str]:
+        return ([] if self.schema_profile == SchemaProfile.NONE else [f"schema={self.schema_profile.value}"]) + super().getConfiguration()
+
+    def getSoftwareVersions(self) -> List[str]:
+        return [f"sqlite {sqlite3.sqlite_version}"]
+
+    def getDurabilityProfiles(self) -> List[DurabilityProfile]:
+        return [DurabilityProfile.STRICT, DurabilityProfile.DEFAULT, DurabilityProfile.RELAXED, DurabilityProfile.NONE]
+
+    def setDurabilityProfile(self, durability_profile: DurabilityProfile):
+        super().setDurabilityProfile(durability_profile)
+        journal_mode, synchronous = self.DURABILITY_SETTINGS[durability_profile]
+        self.connection.commit()
+        self.connection.execute(f"PRAGMA journal_mode={journal_mode or self.journal_mode}")
+        self.connection.execute(f"PRAGMA synchronous={synchronous}")
\ No newline at end of file
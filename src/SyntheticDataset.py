@@ -0,0 +1,112 @@
+import hashlib
+import math
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Iterator, List, Tuple
+import numpy as np
+
+class KeyDistribution(Enum):
+    SEQUENTIAL = "sequential"
+    UNIFORM = "uniform"
+    ZIPFIAN = "zipfian"
+
+class SyntheticDataset:
+    CACHED_CHUNKS = 2
+
+    def __init__(self, name: str, rows: int, seed: int = 0, distribution: KeyDistribution = KeyDistribution.SEQUENTIAL,
+                 start: datetime = datetime(2022, 1, 1), interval: timedelta = timedelta(minutes=15), time_skew: float = 0.0,
+                 zipf_exponent: float = 1.1, chunk_size: int = 1 << 20,
+                 column_names: List[str] = ["TimeStampFrom", "TimeStampTo", "Value", "Quality"]):
+        self.name = name
+        self.column_names = list(column_names)
+        self.row_count = rows
+        self.seed = seed
+        self.distribution = distribution
+        self.start = (start - EPOCH) // MICROSECOND
+        self.interval = interval // MICROSECOND
+        self.time_skew = time_skew
+        self.zipf_exponent = zipf_exponent
+        self.chunk_size = chunk_size
+        self.multiplier = self.__permutation_multiplier()
+        self.__chunks = OrderedDict()
+
+    def __permutation_multiplier(self) -> int:
+        multiplier = int(np.random.default_rng(self.seed).integers(self.row_count // 2 + 1, self.row_count + 2)) | 1
+        while math.gcd(multiplier, max(self.row_count, 1)) != 1:
+            multiplier += 2
+        return multiplier
+
+    def __keys(self, positions: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        if self.distribution == KeyDistribution.UNIFORM:
+            return (positions * self.multiplier + self.seed) % self.row_count
+        if self.distribution == KeyDistribution.ZIPFIAN:
+            return (rng.zipf(self.zipf_exponent, len(positions)) - 1) % self.row_count
+        return positions
+
+    def __generate_chunk(self, chunk_index: int) -> ColumnarDataset:
+        first_row = chunk_index * self.chunk_size
+        positions = np.arange(first_row, min(first_row + self.chunk_size, self.row_count), dtype=np.int64)
+        rng = np.random.default_rng([self.seed, chunk_index])
+        timestamps_from = self.start + self.__keys(positions, rng) * self.interval
+        if self.time_skew:
+            timestamps_from += rng.normal(0.0, self.time_skew * self.interval, len(positions)).astype(np.int64)
+        timestamps_to = timestamps_from + self.interval
+        values = rng.gamma(2.0, 10.0, len(positions))
+        qualities = rng.integers(0, 4, len(positions), dtype=np.int32)
+        return ColumnarDataset(self.name, self.column_names, (timestamps_from, timestamps_to, values, qualities))
+
+    def __chunk(self, chunk_index: int) -> ColumnarDataset:
+        if chunk_index in self.__chunks:
+            self.__chunks.move_to_end(chunk_index)
+        else:
+            self.__chunks[chunk_index] = self.__generate_chunk(chunk_index)
+            if len(self.__chunks) > self.CACHED_CHUNKS:
+                self.__chunks.popitem(last=False)
+        return self.__chunks[chunk_index]
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def rows(self, start: int, stop: int) -> RowSlice:
+        start = min(max(start, 0), self.row_count)
+        stop = max(start, min(stop, self.row_count))
+        first_chunk, last_chunk = start // self.chunk_size, max(stop - 1, start) // self.chunk_size
+        if first_chunk == last_chunk:
+            chunk_start = first_chunk * self.chunk_size
+            return self.__chunk(first_chunk).rows(start - chunk_start, stop - chunk_start)
+
+        parts = []
+        for chunk_index in range(first_chunk, last_chunk + 1):
+            chunk_start = chunk_index * self.chunk_size
+            parts.append(self.__chunk(chunk_index).rows(max(start, chunk_start) - chunk_start, min(stop, chunk_start + self.chunk_size) - chunk_start))
+        columns = tuple(np.concatenate([np.asarray(part.column(index)) for part in parts]) for index in range(4))
+        return ColumnarDataset(self.name, self.column_names, columns).rows(0, stop - start)
+
+    def __chunk_ranges(self, start: int, stop: int) -> Iterator[Tuple[int, int, int]]:
+        start = min(max(start, 0), self.row_count)
+        stop = max(start, min(stop, self.row_count))
+        for chunk_index in range(start // self.chunk_size, -(-stop // self.chunk_size)):
+            chunk_start = chunk_index * self.chunk_size
+            yield chunk_index, max(start, chunk_start) - chunk_start, min(stop, chunk_start + self.chunk_size) - chunk_start
+
+    def prepare(self, start: int, stop: int):
+        for chunk_index, chunk_start, chunk_stop in self.__chunk_ranges(start, stop):
+            self.__chunk(chunk_index).prepare(chunk_start, chunk_stop)
+
+    def release(self, start: int, stop: int):
+        for chunk_index, chunk_start, chunk_stop in self.__chunk_ranges(start, stop):
+            if chunk_index in self.__chunks:
+                self.__chunks[chunk_index].release(chunk_start, chunk_stop)
+
+    def batches(self, batch_size: int, start: int = 0) -> Iterator[RowSlice]:
+        for batch_start in range(start, self.row_count, batch_size):
+            yield self.rows(batch_start, batch_start + batch_size)
+
+    def materialize(self) -> ColumnarDataset:
+        batch = self.rows(0, self.row_count)
+        return ColumnarDataset(self.name, self.column_names, tuple(np.asarray(batch.column(index)) for index in range(4)))
+
+    def fingerprint(self) -> str:
+        parameters = (self.name, self.column_names, self.row_count, self.seed, self.distribution.value, self.start, self.interval, self.time_skew, self.zipf_exponent, self.chunk_size)
+        return hashlib.sha1(repr(parameters).encode()).hexdigest()
\ No newline at end of file
@@ -0,0 +1,114 @@
+import random
+import time
+from typing import Dict, List, Tuple
+import matplotlib.pyplot as plt
+
+YCSB_WORKLOADS = {
+    "A": {"read": 0.5, "update": 0.5},
+    "B": {"read": 0.95, "update": 0.05},
+    "C": {"read": 1.0},
+    "insert_heavy": {"create": 0.9, "read": 0.1}
+}
+
+class WorkloadScheduler:
+    OPERATIONS = ('create', 'read', 'update', 'delete')
+
+    def __init__(self, databaseList: List[DatabaseTestingInterface], ratios: Dict[str, float], recordsPerTransaction: int = 1, readMode: ReadMode = ReadMode.LIMIT, seed: int = 0):
+        unknown = set(ratios) - set(self.OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations in workload: {sorted(unknown)}")
+        self.databaseList = databaseList
+        self.ratios = ratios
+        self.recordsPerTransaction = recordsPerTransaction
+        self.readMode = readMode
+        self.seed = seed
+        self.latencyHistograms: Dict[Tuple[str, float, str], LatencyHistogram] = {}
+        self.curves: Dict[str, Dict[float, Dict[str, float]]] = {}
+
+    def __schedule(self, count: int, slots: int) -> List[Tuple[str, int]]:
+        generator = random.Random(self.seed)
+        operations = generator.choices(list(self.ratios), weights=list(self.ratios.values()), k=count)
+        return [(operation, generator.randrange(slots)) for operation in operations]
+
+    def __method(self, database: DatabaseTestingInterface, operation: str):
+        if operation == 'read':
+            return lambda offset: database.read(self.recordsPerTransaction, offset=offset, read_mode=self.readMode)
+        method = getattr(database, operation)
+        return lambda offset: method(self.recordsPerTransaction, offset=offset)
+
+    def runOnce(self, database: DatabaseTestingInterface, targetRate: float, duration: float = 10.0, tableSize: int = 10000, warmup: float = 1.0) -> Dict[str, float]:
+        tableSize = min(tableSize, database.getDatasetSize())
+        slots = max(tableSize // self.recordsPerTransaction, 1)
+        warmupOperations = int(warmup * targetRate)
+        schedule = self.__schedule(warmupOperations + int(duration * targetRate), slots)
+        insertedRecords = sum(operation == 'create' for operation, _ in schedule) * self.recordsPerTransaction
+        if tableSize + insertedRecords > database.getDatasetSize():
+            raise ValueError(f"Workload inserts {insertedRecords} records but only {database.getDatasetSize() - tableSize} remain in the dataset")
+
+        methods = {operation: self.__method(database, operation) for operation in self.ratios}
+        database.truncate()
+        database.create(tableSize, insert_mode=InsertMode.BULK)
+
+        name = database.getName()
+        histograms = {operation: LatencyHistogram() for operation in self.ratios}
+        histograms['all'] = LatencyHistogram()
+        serviceHistogram = LatencyHistogram()
+        interval = 1e9 / targetRate
+        inserts = 0
+
+        begin = time.perf_counter_ns()
+        for index, (operation, slot) in enumerate(schedule):
+            intendedStart = begin + int(index * interval)
+            offset = slot * self.recordsPerTransaction
+            if operation == 'create':
+                offset = tableSize + inserts * self.recordsPerTransaction
+                inserts += 1
+            database.prepareRows(offset, offset + self.recordsPerTransaction)
+            delay = intendedStart - time.perf_counter_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+
+            start = time.perf_counter_ns()
+            methods[operation](offset)
+            end = time.perf_counter_ns()
+            database.releaseRows(offset, offset + self.recordsPerTransaction)
+
+            if index == warmupOperations:
+                measuredStart = intendedStart
+            if index >= warmupOperations:
+                histograms[operation].record(end - intendedStart)
+                histograms['all'].record(end - intendedStart)
+                serviceHistogram.record(end - start)
+        elapsed = (time.perf_counter_ns() - measuredStart) / 1e9 if len(schedule) > warmupOperations else 0.0
+
+        for operation, histogram in histograms.items():
+            self.latencyHistograms[(name, targetRate, operation)] = histogram
+        result = histograms['all'].summary()
+        result['targetRate'] = targetRate
+        result['throughput'] = histograms['all'].count / elapsed if elapsed else 0.0
+        result['serviceP99'] = serviceHistogram.percentile(99.0) / 1e9
+        self.curves.setdefault(name, {})[targetRate] = result
+        return result
+
+    def run(self, targetRates: List[float], duration: float = 10.0, tableSize: int = 10000, warmup: float = 1.0) -> Dict[str, Dict[float, Dict[str, float]]]:
+        for database in self.databaseList:
+            for targetRate in targetRates:
+                self.runOnce(database, targetRate, duration, tableSize, warmup)
+        return self.curves
+
+    def drawGraphs(self):
+        for name, curve in self.curves.items():
+            targetRates = sorted(curve)
+            throughputs = [curve[targetRate]['throughput'] for targetRate in targetRates]
+            line, = plt.plot(throughputs, [curve[targetRate]['p99'] for targetRate in targetRates], marker='o', label=f'{name} p99')
+            plt.plot(throughputs, [curve[targetRate]['p50'] for targetRate in targetRates], marker='.', linestyle='--', color=line.get_color(), label=f'{name} p50')
+        workload = ", ".join(f"{ratio:g} {operation}" for operation, ratio in self.ratios.items())
+        plt.yscale('log')
+        plt.title(f'Latency against throughput for {workload} with {self.recordsPerTransaction} records per transaction.')
+        plt.xlabel('Achieved throughput (operations per second)')
+        plt.ylabel('Latency from intended start (seconds)')
+        plt.legend()
+        plt.show()
+
+    def getLatencyCurves(self):
+        return self.curves
\ No newline at end of file